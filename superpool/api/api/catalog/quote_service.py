@@ -185,7 +185,10 @@ class QuoteService:
         Fetch products matching the query asynchronously.
         """
         products = await sync_to_async(list)(
-            Product.objects.filter(query).prefetch_related("tiers", "tiers__coverages")
+            Product.objects.filter(query)
+            .lite()
+            .select_related("provider")
+            .prefetch_related("tiers", "tiers__coverages")
         )
         logger.info(f"Fetched products: {[product.name for product in products]}")
         return products
@@ -331,7 +334,7 @@ class QuoteService:
 
         # fetch all quotes for the products matching the product information
         quotes = await sync_to_async(
-            lambda: list(Quote.objects.filter(query).distinct())
+            lambda: list(Quote.objects.filter(query).with_relations().distinct())
         )()
         logger.info(
             f"Retrieved {len(quotes)} {'external' if origin == 'External' else 'internal'} quotes from DB"
@@ -182,7 +182,7 @@ class PolicyPurchaseResponseSerializer(serializers.ModelSerializer):
     policy_reference_number = serializers.CharField(source="policy_number")
     customer_information = serializers.SerializerMethodField()
     renewal_information = serializers.SerializerMethodField()
-    insurer = serializers.CharField(source="provider_id.name")
+    insurer = serializers.CharField(source="provider.name")
     product_information = serializers.SerializerMethodField()
     policy_status = serializers.CharField(source="status")
 
@@ -1224,7 +1224,7 @@ class PolicyMetadataSerializer(serializers.ModelSerializer):
 
     product_name = serializers.CharField(source="product.name")
     product_type = serializers.CharField(source="product.product_type")
-    insurer = serializers.CharField(source="provider_id.name")
+    insurer = serializers.CharField(source="provider.name")
     customer_name = serializers.SerializerMethodField()
     customer_email = serializers.EmailField(source="policy_holder.email")
     customer_phone = serializers.CharField(source="policy_holder.phone_number")
@@ -1321,7 +1321,7 @@ class PolicySerializer(ModelSerializer):
 
     policy_holder = PolicyCustomerSerializer()
     merchant = serializers.CharField(source="merchant.name")
-    provider = PolicyProviderSerializer(source="provider_id")
+    provider = PolicyProviderSerializer()
     beneficiaries = serializers.ListSerializer(child=PolicyBeneficiarySerializer())
     policy_type = serializers.SerializerMethodField()
 
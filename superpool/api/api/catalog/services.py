@@ -219,7 +219,7 @@ class PolicyService:
         """
         Returns a queryset of all policies
         """
-        return Policy.objects.all()
+        return Policy.objects.with_relations()
 
     @staticmethod
     def list_policies_by_product_type() -> QuerySet:
@@ -228,7 +228,7 @@ class PolicyService:
         """
         return Policy.objects.filter(
             models.Q(product__product_type=models.F("product_type"))
-        ).select_related("product", "provider_id")
+        ).select_related("product", "provider")
 
     @staticmethod
     def get_policy(policy_id=None, policy_number=None):
@@ -485,7 +485,7 @@ class PolicyService:
             product=product,
             premium=policy_price,
             merchant=merchant,
-            provider_id=policy_provider,
+            provider=policy_provider,
             renewable=activation_details.get("renew"),
             renewal_date=renewal_date,
             effective_from=datetime.now().date(),
@@ -1136,7 +1136,8 @@ class QuoteService(IQuote):
                 provider__name__in=providers_list,
                 product_type=product_type,
             )
-            # .select_related("provider")
+            .lite()
+            .select_related("provider")
             .prefetch_related("tiers", "tiers__coverages")
         )
 
@@ -72,8 +72,8 @@ class PolicyFactory(factory.django.DjangoModelFactory):
     effective_from = fake.date()
     effective_through = fake.date()
     premium = fake.random_number(digits=3)
-    merchant_id = factory.SubFactory(MerchantFactory)
-    provider_id = factory.SubFactory(PartnerFactory)
+    merchant = factory.SubFactory(MerchantFactory)
+    provider = factory.SubFactory(PartnerFactory)
 
 
 class PriceFactory(factory.django.DjangoModelFactory):
@@ -0,0 +1,67 @@
+"""
+Query count regression tests for the policy and quote list serializers
+
+Serializing a page of objects must cost a fixed number of queries, regardless
+of how many objects are on the page. If one of these starts failing, a
+relation rendered by the serializer is no longer being loaded up front.
+"""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from api.catalog.serializers import PolicySerializer, QuoteSerializer
+from api.merchants.tests.factories import MerchantFactory
+from core.catalog.models import Beneficiary, Policy, Quote
+
+from .factories import PolicyFactory, PriceFactory, QuoteFactory
+
+PAGE_SIZE = 5
+
+
+def create_beneficiary():
+    return Beneficiary.objects.create(
+        first_name="Ada",
+        last_name="Obi",
+        email=f"{uuid.uuid4().hex}@example.com",
+        phone_number="08012345678",
+    )
+
+
+@pytest.mark.django_db
+def test_policy_list_serialization_query_count_is_constant(
+    django_assert_num_queries,
+):
+    merchant = MerchantFactory()
+    for _ in range(PAGE_SIZE):
+        policy = PolicyFactory(merchant_id=merchant.pk)
+        policy.attach_beneficiaries([create_beneficiary(), create_beneficiary()])
+
+    # one query for the policies and their foreign keys, one for beneficiaries
+    with django_assert_num_queries(2):
+        data = PolicySerializer(Policy.objects.with_relations(), many=True).data
+
+    assert len(data) == PAGE_SIZE
+    assert all(len(policy["beneficiaries"]) == 2 for policy in data)
+    assert data[0]["beneficiaries"][0]["beneficiary_name"] == "Ada Obi"
+
+
+@pytest.mark.django_db
+def test_quote_list_serialization_query_count_is_constant(
+    django_assert_num_queries,
+):
+    for index in range(PAGE_SIZE):
+        price = PriceFactory(
+            amount=Decimal("1000.00") + index,
+            commision=Decimal("0.10"),
+            discount_amount=Decimal("0.00"),
+            surcharges=Decimal("0.00"),
+        )
+        QuoteFactory(quote_code=f"Q-{uuid.uuid4().hex[:12]}", premium=price)
+
+    # one query for the quotes, their products and prices, one for coverages
+    with django_assert_num_queries(2):
+        data = QuoteSerializer(Quote.objects.with_relations(), many=True).data
+
+    assert len(data) == PAGE_SIZE
@@ -1,7 +1,12 @@
+from unittest.mock import AsyncMock
+
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
+
+from api.catalog.views import QuoteRequestView
 
 from .factories import PolicyFactory
 
@@ -58,3 +63,59 @@ class TestQuoteView:
 
     def merchant_with_invalid_quote_parameters_results_in_api_error(self):
         pass
+
+
+class TestQuoteRequestView:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    @pytest.fixture
+    def request_quote(self, mocker):
+        mocker.patch(
+            "api.catalog.views.QuoteResponseSerializerV2"
+        ).return_value.data = [{"quote_code": "Q-1"}]
+        return mocker.patch(
+            "api.catalog.views.QuoteServiceV2.request_quote", new_callable=AsyncMock
+        )
+
+    def post_quote_request(self, tenant_id, first_name, date_of_birth):
+        request = APIRequestFactory().post(
+            reverse("request-quote"),
+            {
+                "customer_metadata": {
+                    "first_name": first_name,
+                    "last_name": "Obi",
+                    "email": "ada@example.com",
+                    "residential_address": "1 Marina, Lagos",
+                    "date_of_birth": date_of_birth,
+                },
+                "insurance_details": {"product_type": "Life"},
+            },
+            format="json",
+            HTTP_X_TENANT_ID=tenant_id,
+        )
+        return QuoteRequestView.as_view()(request)
+
+    def test_identical_requests_are_served_from_the_cache(self, request_quote):
+        self.post_quote_request("tenant-a", "Ada", "1990-01-01")
+        response = self.post_quote_request("tenant-a", "Ada", "1990-01-01")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert request_quote.await_count == 1
+
+    @pytest.mark.parametrize(
+        "tenant_id,first_name,date_of_birth",
+        [
+            ("tenant-b", "Ada", "1990-01-01"),
+            ("tenant-a", "Chidi", "1990-01-01"),
+            ("tenant-a", "Ada", "1960-01-01"),
+        ],
+    )
+    def test_quotes_are_not_shared_across_customers_or_merchants(
+        self, request_quote, tenant_id, first_name, date_of_birth
+    ):
+        self.post_quote_request("tenant-a", "Ada", "1990-01-01")
+        self.post_quote_request(tenant_id, first_name, date_of_birth)
+
+        assert request_quote.await_count == 2
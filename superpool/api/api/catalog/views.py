@@ -2,6 +2,7 @@ import logging
 from datetime import timedelta
 
 from asgiref.sync import async_to_sync
+from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned
 from django.db.models import DecimalField, F, Q, QuerySet, Value
 from django.db.models.functions import Cast, Coalesce, NullIf
@@ -25,7 +26,7 @@ from typing_extensions import deprecated
 from api.catalog.exceptions import QuoteNotFoundError
 from api.catalog.permissions import AdminOnlyInsurerFilterPermission
 from api.catalog.serializers import PolicyPurchaseResponseSerializer
-from core.catalog.models import Policy, Product, Quote
+from core.catalog.models import QUOTE_CACHE_TIMEOUT, Policy, Product, Quote
 from core.models import Coverage
 
 from .exceptions import ProductNotFoundError
@@ -953,13 +954,28 @@ class QuoteRequestView(views.APIView):
         service = QuoteServiceV2()
 
         try:
-            quote_data = async_to_sync(service.request_quote)(validated_data)
-            logger.info(f"Retrieved Quote Data: {quote_data}")
-            print(f"Type of quote_data: {type(quote_data)}")
-            paginator = LimitOffsetPagination()
-            paginated_quotes = paginator.paginate_queryset(quote_data, request)
+            # identical quote requests return the same quotes, so we keep the serialized
+            # quotes around for a while, rather than calling out to the providers again.
+            # Quotes are priced for the customer (e.g by age) and issued to the merchant
+            # requesting them, so both are part of the key
+            cache_key = Quote.cache_key(
+                request.headers.get("X-Tenant-ID"),
+                validated_data.get("customer_metadata"),
+                validated_data["insurance_details"],
+                validated_data.get("coverage_preferences"),
+            )
+            serializer_data = cache.get(cache_key)
+
+            if serializer_data is None:
+                quote_data = async_to_sync(service.request_quote)(validated_data)
+                logger.info(f"Retrieved Quote Data: {quote_data}")
+                serializer_data = list(
+                    QuoteResponseSerializerV2(quote_data, many=True).data
+                )
+                if serializer_data:
+                    cache.set(cache_key, serializer_data, QUOTE_CACHE_TIMEOUT)
 
-            if quote_data == []:
+            if not serializer_data:
                 return Response(
                     {
                         "error": "No quotes found for the provided criteria. Try query again"
@@ -967,15 +983,12 @@ class QuoteRequestView(views.APIView):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
+            paginator = LimitOffsetPagination()
+            paginated_quotes = paginator.paginate_queryset(serializer_data, request)
+
             if paginated_quotes is not None:
-                response_serializer = QuoteResponseSerializerV2(
-                    paginated_quotes, many=True
-                )
-                serializer_data = response_serializer.data
-                return paginator.get_paginated_response(serializer_data)
+                return paginator.get_paginated_response(paginated_quotes)
 
-            response_serializer = QuoteResponseSerializerV2(quote_data, many=True)
-            serializer_data = response_serializer.data
             return Response(
                 {
                     "message": "Quote successfully retrieved",
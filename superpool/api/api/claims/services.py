@@ -2,7 +2,6 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Union
 
-from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from django.db.models import Q, QuerySet
 from django.db.utils import IntegrityError
@@ -10,9 +9,8 @@ from django.shortcuts import get_object_or_404
 from rest_framework.serializers import ValidationError
 
 from api.notifications.services import PolicyNotificationService
-from core.catalog.models import Beneficiary, Policy
+from core.catalog.models import Policy
 from core.claims.models import Claim, ClaimDocument, StatusTimeline
-from core.user.models import Customer
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +46,7 @@ class ClaimService(IClaim):
         """
         Retrieve a list of claim based on query parameters
         """
-        queryset = Claim.objects.all()
+        queryset = Claim.objects.with_relations().with_latest_status()
 
         # If no query parameters are provided, return all claims
         if not query_params:
@@ -101,9 +99,9 @@ class ClaimService(IClaim):
         """
         id = claim_id if claim_id is not None else None
         if claim_id:
-            return Claim.objects.get(id=id)
+            return Claim.objects.with_relations().get(id=id)
         if claim_number:
-            return Claim.objects.get(claim_number=claim_number)
+            return Claim.objects.with_relations().get(claim_number=claim_number)
 
     @staticmethod
     def submit_claim(validated_data):
@@ -197,8 +195,6 @@ class ClaimService(IClaim):
 
         if claimant_role == "policyholder":
             claimant = policy.policy_holder
-            claimant_type = "customer"
-            claimant_content_type = ContentType.objects.get_for_model(Customer)
         else:
             # retrieve the beneficiary who is making the claim
             claimant_birth_date = claimant_metadata.get("birth_date")
@@ -208,30 +204,25 @@ class ClaimService(IClaim):
                     email=claimant_metadata.get("email"),
                     date_of_birth=claimant_birth_date,
                 )
-                claimant_content_type = ContentType.objects.get_for_model(Beneficiary)
-                claimant_type = "beneficiary"
             else:
                 claimant = policy.beneficiaries.get(
                     email=claimant_metadata.get("email")
                 )
-                claimant_content_type = ContentType.objects.get_for_model(Beneficiary)
-                claimant_type = "beneficiary"
 
         product = policy.product
         provider = product.provider
 
-        claim = Claim.objects.create(
+        claim = Claim(
             incident_date=claim_details["incident_date"],
             amount=claim_details.get("claim_amount", 0.0),
             estimated_loss=claim_details.get("claim_amount", 0.0),
             policy=policy,
-            claimant_type=claimant_type,
-            claimant_content_type=claimant_content_type,
-            claimant_object_id=claimant.id,
             provider=provider,
             product=product,
             status="pending",
         )
+        claim.set_claimant(claimant)
+        claim.save(force_insert=True)
 
         ClaimService._create_claim_documents(
             claim, claim_details.get("supporting_documents", [])
@@ -10,4 +10,10 @@ app = Celery("superpool",
 )
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
-app.autodiscover_tasks()
\ No newline at end of file
+app.autodiscover_tasks()
+app.conf.beat_schedule = {
+    "expire-stale-quotes": {
+        "task": "core.catalog.tasks.expire_stale_quotes",
+        "schedule": 60.0,
+    },
+}
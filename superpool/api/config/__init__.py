@@ -0,0 +1,5 @@
+# load the celery app whenever django starts, so tasks dispatched from the web
+# process (e.g `send_email.delay()`) go to the configured broker
+from celery_app import app as celery_app
+
+__all__ = ("celery_app",)
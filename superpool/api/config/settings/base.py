@@ -280,6 +280,15 @@ MANAGERS = ADMINS
 
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Hand platform emails to the Celery worker instead of sending them during the
+# request. Keep this off wherever no worker is deployed, or emails are never sent
+SUPERPOOL_SEND_EMAILS_ASYNC = env.bool("SUPERPOOL_SEND_EMAILS_ASYNC", default=False)
+
+# Rows sent per INSERT when the ingest commands create records in bulk
+SUPERPOOL_BULK_CREATE_BATCH_SIZE = env.int(
+    "SUPERPOOL_BULK_CREATE_BATCH_SIZE", default=100
+)
+
 # INSURANCE PARTNERS
 #
 # Heirs Holdings
@@ -1,5 +1,6 @@
 from typing import Union
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import URLPattern, URLResolver, include, path
 from drf_spectacular.views import (
@@ -65,3 +66,11 @@ swagger_urlpatterns = [
 ]
 
 urlpatterns += swagger_urlpatterns
+
+# Profiling tools are only installed when `ENABLE_PROFILING` is set,
+# see `config.settings.environments.local`
+if "debug_toolbar" in settings.INSTALLED_APPS:
+    urlpatterns += [path("__debug__/", include("debug_toolbar.urls"))]
+
+if "silk" in settings.INSTALLED_APPS:
+    urlpatterns += [path("silk/", include("silk.urls", namespace="silk"))]
@@ -5,9 +5,11 @@ from .models import Policy, Product
 
 @admin.register(Product)
 class ProductAdmin(admin.ModelAdmin):
-    pass
+    # rows are rendered with `Product.__str__`, which reads the provider's name
+    list_select_related = ("provider",)
 
 
 @admin.register(Policy)
 class PolicyAdmin(admin.ModelAdmin):
-    pass
+    # rows are rendered with `Policy.__str__`, which reads the policy holder's name
+    list_select_related = ("policy_holder",)
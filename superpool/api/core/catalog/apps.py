@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CatalogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core.catalog"
+
+    def ready(self):
+        from core.catalog import signals  # noqa: F401
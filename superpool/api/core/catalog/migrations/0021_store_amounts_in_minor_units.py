@@ -0,0 +1,119 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:06
+
+from decimal import Decimal
+
+from django.db import migrations
+
+import core.fields
+
+AMOUNT_COLUMNS = [
+    ("catalog_policy", "premium"),
+    ("catalog_price", "amount"),
+    ("catalog_price", "discount_amount"),
+    ("catalog_price", "surcharges"),
+    ("catalog_product", "base_premium"),
+    ("catalog_producttier", "base_premium"),
+    ("catalog_quote", "base_price"),
+]
+
+
+def convert_to_minor_units(apps, schema_editor):
+    """
+    Rewrites existing amounts from major units (e.g 1250.50) into minor units (e.g 125050)
+    """
+    quote_name = schema_editor.quote_name
+    for table, column in AMOUNT_COLUMNS:
+        if schema_editor.connection.vendor == "postgresql":
+            sql = "ALTER TABLE {table} ALTER COLUMN {column} TYPE bigint USING ROUND({column} * 100)::bigint"
+        else:
+            sql = "UPDATE {table} SET {column} = ROUND({column} * 100)"
+        schema_editor.execute(
+            sql.format(table=quote_name(table), column=quote_name(column))
+        )
+
+
+def convert_to_major_units(apps, schema_editor):
+    quote_name = schema_editor.quote_name
+    for table, column in AMOUNT_COLUMNS:
+        if schema_editor.connection.vendor == "postgresql":
+            sql = "ALTER TABLE {table} ALTER COLUMN {column} TYPE numeric(10, 2) USING {column} / 100.0"
+        else:
+            sql = "UPDATE {table} SET {column} = {column} / 100.0"
+        schema_editor.execute(
+            sql.format(table=quote_name(table), column=quote_name(column))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0020_alter_price_unique_together"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(convert_to_minor_units, convert_to_major_units),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="policy",
+                    name="premium",
+                    field=core.fields.MinorUnitAmountField(
+                        decimal_places=2,
+                        help_text="Amount paid for the policy",
+                        max_digits=10,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="price",
+                    name="amount",
+                    field=core.fields.MinorUnitAmountField(
+                        decimal_places=2, max_digits=10
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="price",
+                    name="discount_amount",
+                    field=core.fields.MinorUnitAmountField(
+                        blank=True, decimal_places=2, max_digits=10, null=True
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="price",
+                    name="surcharges",
+                    field=core.fields.MinorUnitAmountField(
+                        blank=True, decimal_places=2, max_digits=10, null=True
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="product",
+                    name="base_premium",
+                    field=core.fields.MinorUnitAmountField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        help_text="Base premium price if no tiers are defined",
+                        max_digits=10,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="producttier",
+                    name="base_premium",
+                    field=core.fields.MinorUnitAmountField(
+                        decimal_places=2,
+                        help_text="The base premium price for this tier before any adjustments or discounts",
+                        max_digits=10,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="quote",
+                    name="base_price",
+                    field=core.fields.MinorUnitAmountField(
+                        decimal_places=2,
+                        help_text="Price of quote excluding  discount",
+                        max_digits=10,
+                    ),
+                ),
+            ],
+        ),
+    ]
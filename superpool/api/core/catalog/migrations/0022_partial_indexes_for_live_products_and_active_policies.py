@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("catalog", "0021_store_amounts_in_minor_units"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="policy",
+            index=models.Index(
+                condition=models.Q(("status", "active")),
+                fields=["policy_holder", "effective_through"],
+                name="policy_active_holder_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("is_live", True), ("is_trashed", False)),
+                fields=["product_type"],
+                name="product_live_type_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:32
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("catalog", "0022_partial_indexes_for_live_products_and_active_policies"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="quote",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["additional_metadata"],
+                name="quote_meta_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
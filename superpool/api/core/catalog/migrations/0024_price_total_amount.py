@@ -0,0 +1,40 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:17
+
+import core.fields
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0023_quote_additional_metadata_gin_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="price",
+            name="total_amount",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F("amount"),
+                    "-",
+                    django.db.models.functions.comparison.Coalesce(
+                        "discount_amount", 0
+                    ),
+                ),
+                help_text="Amount payable after the discount, computed by the database",
+                output_field=core.fields.MinorUnitAmountField(
+                    decimal_places=2, max_digits=10
+                ),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="price",
+            index=models.Index(
+                fields=["total_amount"], name="catalog_pri_total_a_4278c9_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:20
+
+import core.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0024_price_total_amount"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="beneficiary",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="policy",
+            name="policy_id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                help_text="Unique identifier for the policy",
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="product",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                help_text="Unique identifier for the package",
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="producttier",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
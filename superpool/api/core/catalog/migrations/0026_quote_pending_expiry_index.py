@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:21
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("catalog", "0025_time_ordered_uuid_primary_keys"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="quote",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["expires_in"],
+                name="quote_pending_exp_idx",
+            ),
+        ),
+    ]
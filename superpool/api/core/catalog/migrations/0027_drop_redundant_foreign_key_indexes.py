@@ -0,0 +1,47 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0026_quote_pending_expiry_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="policy",
+            name="policy_holder",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="User who purchased the policy",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="policies",
+                to="core.customer",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="policy",
+            name="provider_id",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Insurance provider for the policy",
+                on_delete=django.db.models.deletion.CASCADE,
+                to="core.provider",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="producttier",
+            name="product",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Insurance package the tier belongs to",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tiers",
+                related_query_name="tier",
+                to="catalog.product",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0027_drop_redundant_foreign_key_indexes"),
+    ]
+
+    operations = [
+        # the index keeps its name and column, only the field it refers to is renamed
+        # in the migration state, so there is no need to rebuild it in the database
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name="policy",
+                    name="catalog_pol_provide_90772d_idx",
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="policy",
+            name="provider_id",
+            field=models.ForeignKey(
+                db_column="provider_id_id",
+                db_index=False,
+                help_text="Insurance provider for the policy",
+                on_delete=django.db.models.deletion.CASCADE,
+                to="core.provider",
+            ),
+        ),
+        migrations.RenameField(
+            model_name="policy",
+            old_name="provider_id",
+            new_name="provider",
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="policy",
+                    index=models.Index(
+                        fields=["provider"], name="catalog_pol_provide_90772d_idx"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:26
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("catalog", "0028_rename_policy_provider_id"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="policy",
+            index=models.Index(
+                fields=["policy_holder", "status", "-effective_through"],
+                name="policy_holder_status_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="policy",
+            index=models.Index(
+                fields=["merchant", "status", "-effective_through"],
+                name="policy_merchant_status_idx",
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="policy",
+            name="catalog_pol_effecti_11fbed_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="policy",
+            name="catalog_pol_policy__3c29a2_idx",
+        ),
+        migrations.AlterField(
+            model_name="policy",
+            name="merchant",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Merchant who sold the policy",
+                on_delete=django.db.models.deletion.CASCADE,
+                to="merchants.merchant",
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0029_policy_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="product",
+            name="product_type",
+            field=models.CharField(
+                choices=[
+                    ("Life", "Life Insurance"),
+                    ("Health", "Health Insurance"),
+                    ("Auto", "Auto Insurance"),
+                    ("Cargo", "Cargo (Shipment) Insurance"),
+                    ("Gadget", "Gadget Insurance"),
+                    ("Travel", "Travel Insurance"),
+                    ("Home", "Home Insurance"),
+                    ("Student_Protection", "Student Protection"),
+                    ("Accident", "Accident Insurance"),
+                    ("Personal_Accident", "Personal Accident Insurance"),
+                    ("CreditLife", "Credit Life Insurance"),
+                    ("PetCare", "PetCare Insurance"),
+                    ("General", "General Insurance"),
+                    ("Other", "Other"),
+                ],
+                help_text="Type of insurance package",
+                max_length=32,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="producttier",
+            name="tier_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("Basic", "Basic Insurance"),
+                    ("Advanced", "Advanced"),
+                    ("Standard", "Standard Insurance"),
+                    ("Premium", "Premium"),
+                    ("Bronze", "Bronze"),
+                    ("Silver", "Silver"),
+                    ("Comprehensive", "Comprehensive"),
+                    ("ThirdParty", "ThirdParty"),
+                    ("Other", "Other"),
+                ],
+                help_text="Type of tier. Choose from predefined options such as Basic, Premium, Silver, Corporate, Comprehensive, etc. An optional classification that further categorizes the tier",
+                max_length=32,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="quote",
+            name="origin",
+            field=models.CharField(
+                choices=[("Internal", "Internal"), ("External", "External")],
+                default="Internal",
+                help_text="The origin of the quote, e.g., Internal, or External provider",
+                max_length=16,
+            ),
+        ),
+    ]
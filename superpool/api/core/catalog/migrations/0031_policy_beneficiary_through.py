@@ -0,0 +1,69 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0030_shrink_choice_column_lengths"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="beneficiary",
+            name="email",
+            field=models.EmailField(max_length=254),
+        ),
+        # The table behind the implicit many-to-many already has this exact
+        # shape, so the explicit through model only needs to exist in the state
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="PolicyBeneficiary",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "beneficiary",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                to="catalog.beneficiary",
+                            ),
+                        ),
+                        (
+                            "policy",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                to="catalog.policy",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "catalog_policy_beneficiaries",
+                        "unique_together": {("policy", "beneficiary")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="policy",
+                    name="beneficiaries",
+                    field=models.ManyToManyField(
+                        blank=True,
+                        help_text="Beneficiaries of this policy",
+                        related_name="beneficiaries",
+                        through="catalog.PolicyBeneficiary",
+                        to="catalog.beneficiary",
+                        verbose_name="Beneficiaries",
+                    ),
+                ),
+            ],
+        ),
+    ]
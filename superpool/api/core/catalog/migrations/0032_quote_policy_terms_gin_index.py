@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:40
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("catalog", "0031_policy_beneficiary_through"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="quote",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["policy_terms"], name="quote_terms_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0032_quote_policy_terms_gin_index"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="price",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="price",
+            constraint=models.UniqueConstraint(
+                models.F("amount"),
+                django.db.models.functions.text.MD5("description"),
+                name="price_amount_descmd5_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.2 on 2026-10-18 08:13
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("catalog", "0033_price_unique_description_digest"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="product",
+            index=models.Index(
+                fields=["provider", "name"], name="product_provider_name_idx"
+            ),
+        ),
+        # the single column provider index is superseded by the index above
+        migrations.AlterField(
+            model_name="product",
+            name="provider",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Insurance provider offering the package",
+                on_delete=django.db.models.deletion.CASCADE,
+                to="core.provider",
+            ),
+        ),
+    ]
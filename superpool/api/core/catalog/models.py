@@ -1,16 +1,40 @@
-import uuid
-from datetime import datetime, timedelta
+import hashlib
+import json
+from datetime import timedelta
 from decimal import Decimal
+from typing import Iterable, Iterator
 
+from django.contrib.postgres.indexes import GinIndex
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Count, Prefetch, Q, Sum
+from django.db.models.functions import MD5, Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.fields import MinorUnitAmountField
 from core.merchants.models import Merchant
-from core.mixins import TimestampMixin, TrashableModelMixin
+from core.mixins import TimestampMixin, TrashableModelMixin, TrashableQuerySet
 from core.providers.models import Provider as Partner
 from core.user.models import Customer
-from core.utils import generate_id
+from core.utils import generate_id, uuid7
+
+LOOKUP_CACHE_TIMEOUT = 60
+""" Number of seconds a cached product or tier lookup stays valid """
+
+QUOTE_CACHE_TIMEOUT = 60 * 5
+""" Number of seconds the quotes returned for a quote request stay cached """
+
+
+def lookup_cache_key(prefix: str, owner_id, name: str) -> str:
+    """
+    Builds the cache key used for `(owner, name)` lookups of catalog objects
+
+    The name is hashed, as product and tier names contain spaces, which are
+    not safe to use in cache keys.
+    """
+    digest = hashlib.md5(name.encode("utf-8")).hexdigest()
+    return f"{prefix}:{owner_id}:{digest}"
 
 
 class ProductTier(models.Model):
@@ -39,21 +63,22 @@ class ProductTier(models.Model):
         THIRDPARTY = "ThirdParty", "ThirdParty"
         OTHER = "Other", "Other"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     product = models.ForeignKey(
         "Product",
         on_delete=models.CASCADE,
         help_text="Insurance package the tier belongs to",
         related_name="tiers",
         related_query_name="tier",
-        db_index=True,
+        # covered by the (product, tier_name) unique index
+        db_index=False,
     )
     tier_name = models.CharField(
         max_length=255,
         help_text="Name of the product tier",
     )
     tier_type = models.CharField(
-        max_length=255,
+        max_length=32,
         choices=TierType.choices,
         blank=True,
         null=True,
@@ -64,7 +89,7 @@ class ProductTier(models.Model):
         null=True,
         blank=True,
     )
-    base_premium = models.DecimalField(
+    base_premium = MinorUnitAmountField(
         max_digits=10,
         decimal_places=2,
         help_text="The base premium price for this tier before any adjustments or discounts",
@@ -101,6 +126,43 @@ class ProductTier(models.Model):
     class Meta:
         unique_together = ("product", "tier_name")
 
+    @classmethod
+    def get_cached(cls, product_id, tier_name: str) -> "ProductTier":
+        """
+        Retrieves a product tier by its product and name, serving repeated
+        lookups from the cache rather than the database.
+
+        Raises `ProductTier.DoesNotExist` if no such tier exists.
+        """
+        cache_key = lookup_cache_key("tier", product_id, tier_name)
+        tier = cache.get(cache_key)
+        if tier is None:
+            tier = cls.objects.get(product_id=product_id, tier_name=tier_name)
+            cache.set(cache_key, tier, LOOKUP_CACHE_TIMEOUT)
+        return tier
+
+
+class ProductQuerySet(TrashableQuerySet):
+    def lite(self) -> "ProductQuerySet":
+        """
+        Skips the product description, which list and quoting paths never read
+        """
+        return self.defer("description")
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Trash every product in the queryset, evicting them from the lookup cache
+
+        Trashing happens in a single UPDATE, which sends no signals
+        """
+        cache.delete_many(
+            [
+                lookup_cache_key("prod", provider_id, name)
+                for provider_id, name in self.values_list("provider_id", "name")
+            ]
+        )
+        return super().delete()
+
 
 class Product(TimestampMixin, TrashableModelMixin, models.Model):
     """
@@ -134,14 +196,15 @@ class Product(TimestampMixin, TrashableModelMixin, models.Model):
     id: models.UUIDField = models.UUIDField(
         primary_key=True,
         help_text="Unique identifier for the package",
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     provider: models.ForeignKey = models.ForeignKey(
         Partner,
         on_delete=models.CASCADE,
         help_text="Insurance provider offering the package",
-        db_index=True,
+        # covered by the (provider, name) index
+        db_index=False,
     )
     name: models.CharField = models.CharField(
         max_length=255,
@@ -151,7 +214,7 @@ class Product(TimestampMixin, TrashableModelMixin, models.Model):
         help_text="Description of the package", null=True, blank=True
     )
     product_type: models.CharField = models.CharField(
-        max_length=255,
+        max_length=32,
         choices=ProductType.choices,
         help_text="Type of insurance package",
     )
@@ -160,7 +223,7 @@ class Product(TimestampMixin, TrashableModelMixin, models.Model):
         blank=True,
         help_text="Detailed breakdown of what's covered",
     )
-    base_premium = models.DecimalField(
+    base_premium = MinorUnitAmountField(
         max_digits=10,
         decimal_places=2,
         help_text="Base premium price if no tiers are defined",
@@ -170,6 +233,8 @@ class Product(TimestampMixin, TrashableModelMixin, models.Model):
         default=True, help_text="Indicates if the package is live"
     )
 
+    objects = ProductQuerySet.as_manager()
+
     def __str__(self) -> str:
         return f"{self.name} - {self.provider.name}"
 
@@ -182,10 +247,60 @@ class Product(TimestampMixin, TrashableModelMixin, models.Model):
     def full_delete(self, *args, **kwargs) -> None:
         return super().full_delete(*args, **kwargs)
 
+    def trash(self) -> None:
+        """
+        Trash the product and evict it from the lookup cache
+        """
+        super().trash()
+        cache.delete(lookup_cache_key("prod", self.provider_id, self.name))
+
+    def restore(self) -> None:
+        """
+        Restore the product and evict it from the lookup cache
+        """
+        super().restore()
+        cache.delete(lookup_cache_key("prod", self.provider_id, self.name))
+
+    @classmethod
+    def get_cached(cls, provider_id, name: str) -> "Product":
+        """
+        Retrieves a product by its provider and name, serving repeated
+        lookups from the cache rather than the database.
+
+        Product names are not unique within a provider, so the most recently
+        created product with that name is returned.
+
+        Raises `Product.DoesNotExist` if no such product exists.
+        """
+        cache_key = lookup_cache_key("prod", provider_id, name)
+        product = cache.get(cache_key)
+        if product is None:
+            product = (
+                cls.objects.filter(provider_id=provider_id, name=name)
+                .order_by("-created_at", "-pk")
+                .first()
+            )
+            if product is None:
+                raise cls.DoesNotExist(
+                    f"No product named {name!r} for provider {provider_id}"
+                )
+            cache.set(cache_key, product, LOOKUP_CACHE_TIMEOUT)
+        return product
+
     class Meta:
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["product_type"]),
+            # products are looked up by name within a provider when ingesting
+            # and quoting
+            models.Index(fields=["provider", "name"], name="product_provider_name_idx"),
+            # most reads only concern products that are live and not trashed,
+            # so we keep a smaller index over just those rows
+            models.Index(
+                fields=["product_type"],
+                name="product_live_type_idx",
+                condition=Q(is_live=True, is_trashed=False),
+            ),
         ]
 
 
@@ -194,11 +309,11 @@ class Beneficiary(models.Model):
     Represents a beneficiary of an insurance policy other than the policy holder
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     first_name = models.CharField(max_length=40)
     middle_name = models.CharField(max_length=40, blank=True, null=True)
     last_name = models.CharField(max_length=40)
-    email = models.EmailField(unique=True, blank=False, null=False)
+    email = models.EmailField(blank=False, null=False)
     phone_number = models.CharField(max_length=15)
     address = models.TextField(null=True)
     relationship = models.CharField(
@@ -210,6 +325,70 @@ class Beneficiary(models.Model):
     )
 
 
+class PolicyQuerySet(TrashableQuerySet):
+    def with_relations(self) -> "PolicyQuerySet":
+        """
+        Loads every relation rendered on policy list endpoints up front, so
+        serializing a page of policies costs a fixed number of queries
+
+        Beneficiaries are listed by name only, so their other columns are left
+        out of the prefetch.
+        """
+        return self.select_related(
+            "product", "policy_holder", "merchant", "provider"
+        ).prefetch_related(
+            Prefetch(
+                "beneficiaries",
+                queryset=Beneficiary.objects.only("id", "first_name", "last_name"),
+            )
+        )
+
+    def lite(self) -> "PolicyQuerySet":
+        """
+        Skips the cancellation reason, for listings that do not render it
+        """
+        return self.defer("cancellation_reason")
+
+    def stream(self, *fields: str, chunk_size: int = 2000) -> Iterator[tuple]:
+        """
+        Iterates over the given policy fields as named tuples, in chunks
+
+        Meant for batch jobs (renewals, reports) scanning a large number of
+        policies: rows are streamed from a server-side cursor and no model
+        instances are built, so memory stays bounded by `chunk_size` rows.
+        """
+        return self.values_list(*fields, named=True).iterator(chunk_size=chunk_size)
+
+    def stats_by(self, *fields: str) -> "PolicyQuerySet":
+        """
+        Aggregates the premium written and the number of active policies per
+        group, e.g `stats_by("provider")` or `stats_by("merchant")`
+
+        The aggregation runs in the database, so no policy rows are loaded.
+        """
+        return (
+            self.order_by()
+            .values(*fields)
+            .annotate(
+                total_premium=Sum("premium"),
+                policy_count=Count("policy_id"),
+                active_count=Count("policy_id", filter=Q(status=Policy.ACTIVE)),
+            )
+        )
+
+    def stats_by_provider(self) -> "PolicyQuerySet":
+        """
+        Premium written and policy counts per insurance provider
+        """
+        return self.stats_by("provider")
+
+    def stats_by_merchant(self) -> "PolicyQuerySet":
+        """
+        Premium written and policy counts per merchant
+        """
+        return self.stats_by("merchant")
+
+
 class Policy(TimestampMixin, TrashableModelMixin, models.Model):
     """
     Insurance policy purchased by a user
@@ -228,7 +407,7 @@ class Policy(TimestampMixin, TrashableModelMixin, models.Model):
 
     policy_id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         help_text="Unique identifier for the policy",
     )
     policy_number = models.CharField(
@@ -247,6 +426,8 @@ class Policy(TimestampMixin, TrashableModelMixin, models.Model):
         on_delete=models.CASCADE,
         help_text="User who purchased the policy",
         related_name="policies",
+        # indexed in `Meta.indexes`
+        db_index=False,
     )
     effective_from: models.DateField = models.DateField(
         help_text="Date the policy was purchased"
@@ -254,7 +435,7 @@ class Policy(TimestampMixin, TrashableModelMixin, models.Model):
     effective_through: models.DateField = models.DateField(
         help_text="Date the policy expires"
     )
-    premium: models.DecimalField = models.DecimalField(
+    premium = MinorUnitAmountField(
         max_digits=10,
         decimal_places=2,
         help_text="Amount paid for the policy",
@@ -269,11 +450,17 @@ class Policy(TimestampMixin, TrashableModelMixin, models.Model):
         Merchant,
         on_delete=models.CASCADE,
         help_text="Merchant who sold the policy",
+        # indexed in `Meta.indexes`
+        db_index=False,
     )
-    provider_id: models.ForeignKey = models.ForeignKey(
+    provider: models.ForeignKey = models.ForeignKey(
         Partner,
         on_delete=models.CASCADE,
         help_text="Insurance provider for the policy",
+        # the field was previously named `provider_id`, keep its column
+        db_column="provider_id_id",
+        # indexed in `Meta.indexes`
+        db_index=False,
     )
     renewable = models.BooleanField(
         default=False, help_text="Indicates if the policy is renewable"
@@ -311,15 +498,35 @@ class Policy(TimestampMixin, TrashableModelMixin, models.Model):
     )
     beneficiaries = models.ManyToManyField(
         Beneficiary,
+        through="PolicyBeneficiary",
         related_name="beneficiaries",
         verbose_name=_("Beneficiaries"),
         help_text=_("Beneficiaries of this policy"),
         blank=True,
     )
 
+    objects = PolicyQuerySet.as_manager()
+
     def __str__(self) -> str:
         return f"#{self.policy_id} bought by User: {self.policy_holder.full_name}"
 
+    def attach_beneficiaries(self, beneficiaries: Iterable["Beneficiary"]) -> None:
+        """
+        Links beneficiaries to this policy, writing every link in a single INSERT
+
+        Unlike `beneficiaries.add()`, this skips the lookup of links that already
+        exist and lets the database drop duplicates instead, so prefer it when
+        attaching more than a handful of beneficiaries at once.
+        """
+        PolicyBeneficiary.objects.bulk_create(
+            [
+                PolicyBeneficiary(policy_id=self.pk, beneficiary_id=beneficiary.pk)
+                for beneficiary in beneficiaries
+            ],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
+
     def delete(self, *args: dict, **kwargs: dict) -> None:
         """
         Override the delete method to trash the model instance
@@ -327,15 +534,39 @@ class Policy(TimestampMixin, TrashableModelMixin, models.Model):
         self.trash()
 
     class Meta:
+        # policies are looked up by their holder or merchant, then narrowed down by
+        # status, so both lead with the equality columns and end with the range column
         indexes = [
             models.Index(
-                fields=["effective_from", "effective_through", "policy_id", "premium"]
+                fields=["policy_holder", "status", "-effective_through"],
+                name="policy_holder_status_idx",
+            ),
+            models.Index(
+                fields=["merchant", "status", "-effective_through"],
+                name="policy_merchant_status_idx",
+            ),
+            models.Index(fields=["provider"]),
+            models.Index(
+                fields=["policy_holder", "effective_through"],
+                name="policy_active_holder_idx",
+                condition=Q(status="active"),
             ),
-            models.Index(fields=["policy_holder"]),
-            models.Index(fields=["provider_id"]),
         ]
 
 
+class PolicyBeneficiary(models.Model):
+    """
+    Links a beneficiary to a policy they are covered by
+    """
+
+    policy = models.ForeignKey(Policy, on_delete=models.CASCADE)
+    beneficiary = models.ForeignKey(Beneficiary, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "catalog_policy_beneficiaries"
+        unique_together = ("policy", "beneficiary")
+
+
 class Price(models.Model):
     """
     Defines the pricing structure for an object e.g a product
@@ -358,18 +589,18 @@ class Price(models.Model):
         FIXED = "Fixed", "Fixed Rate"
         VARIATE = "Dynamic", "Dynamic Rate"
 
-    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    amount = MinorUnitAmountField(max_digits=10, decimal_places=2)
     description = models.TextField(null=True, blank=True)
     commision = models.DecimalField(
         max_digits=3, decimal_places=2, null=True, blank=True
     )
-    discount_amount = models.DecimalField(
+    discount_amount = MinorUnitAmountField(
         max_digits=10,
         decimal_places=2,
         null=True,
         blank=True,
     )
-    surcharges = models.DecimalField(
+    surcharges = MinorUnitAmountField(
         max_digits=10, decimal_places=2, null=True, blank=True
     )
     currency = models.CharField(max_length=3, default="NGN", help_text="Currency code")
@@ -379,9 +610,24 @@ class Price(models.Model):
     frequency = models.CharField(
         max_length=20, choices=PriceFrequency.choices, default=PriceFrequency.MONTHLY
     )
+    total_amount = models.GeneratedField(
+        expression=models.F("amount") - Coalesce("discount_amount", 0),
+        output_field=MinorUnitAmountField(max_digits=10, decimal_places=2),
+        db_persist=True,
+        help_text="Amount payable after the discount, computed by the database",
+    )
 
     class Meta:
-        unique_together = ("amount", "description")
+        constraints = [
+            # descriptions can be long, so uniqueness is enforced on their digest
+            # to keep the index entries small
+            models.UniqueConstraint(
+                models.F("amount"),
+                MD5("description"),
+                name="price_amount_descmd5_uniq",
+            ),
+        ]
+        indexes = [models.Index(fields=["total_amount"])]
 
     def __str__(self):
         return (
@@ -393,6 +639,9 @@ class Price(models.Model):
         Computes the total price for a product tier
 
         Takes into account the `base_preimum` of the product, and discount_amount
+
+        This is computed in Python, so it also reflects unsaved changes. Use the
+        `total_amount` column to filter or sort prices in the database.
         """
         total_price = self.amount
 
@@ -405,6 +654,16 @@ def default_expiry_date():
     return timezone.now() + timedelta(days=30)
 
 
+class QuoteQuerySet(models.QuerySet):
+    def with_relations(self) -> "QuoteQuerySet":
+        """
+        Loads the product, its provider, coverages and the quoted price up front
+        """
+        return self.select_related(
+            "product", "product__provider", "premium"
+        ).prefetch_related("product__coverages")
+
+
 class Quote(models.Model):
     """
     Represents an insurance quote for a policy
@@ -426,7 +685,7 @@ class Quote(models.Model):
 
     # id = models.CharField(max_length=80, primary_key=True, unique=True, editable=False)
     origin = models.CharField(
-        max_length=255,
+        max_length=16,
         help_text="The origin of the quote, e.g., Internal, or External provider",
         choices=[("Internal", "Internal"), ("External", "External")],
         default="Internal",
@@ -444,7 +703,7 @@ class Quote(models.Model):
         editable=False,
         help_text="Assigned identifier for managing quote objects",
     )
-    base_price = models.DecimalField(
+    base_price = MinorUnitAmountField(
         max_digits=10, decimal_places=2, help_text="Price of quote excluding  discount"
     )
     product = models.ForeignKey(
@@ -480,12 +739,71 @@ class Quote(models.Model):
         blank=True,
     )
 
+    objects = QuoteQuerySet.as_manager()
+
     def __str__(self) -> str:
         return f"{self.quote_code} - {self.origin} - ({self.provider})"
 
     class Meta:
         verbose_name = "quote"
         verbose_name_plural = "quotes"
+        indexes = [
+            # `jsonb_path_ops` only serves containment lookups, so metadata should be
+            # queried as `filter(additional_metadata__contains={"tier_name": ...})`
+            GinIndex(
+                fields=["additional_metadata"],
+                name="quote_meta_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+            # policy terms are also looked up by key (e.g `has_key`), which needs the
+            # default `jsonb_ops` operator class
+            GinIndex(fields=["policy_terms"], name="quote_terms_gin"),
+            models.Index(
+                fields=["expires_in"],
+                name="quote_pending_exp_idx",
+                condition=Q(status="pending"),
+            ),
+        ]
+
+    @classmethod
+    def cache_key(cls, *parts) -> str:
+        """
+        Builds the cache key for the quotes returned for a set of quote request inputs
+
+        The inputs are serialized with sorted keys, so requests with the same
+        inputs share a key regardless of the order their fields were sent in.
+        """
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        return f"quote:{digest}"
+
+    @classmethod
+    def bulk_ingest(cls, rows: list[dict], batch_size: int = 1000) -> list["Quote"]:
+        """
+        Creates quotes from a list of field values in batched INSERTs, e.g when
+        ingesting quotes from an external provider
+
+        Rows that conflict with existing quotes are skipped.
+        """
+        quotes = [cls(**row) for row in rows]
+        for quote in quotes:
+            # `bulk_create` skips `save()`, which is where quote codes are normally assigned
+            if not quote.quote_code:
+                quote.quote_code = generate_id(cls)
+        return cls.objects.bulk_create(
+            quotes, batch_size=batch_size, ignore_conflicts=True
+        )
+
+    @classmethod
+    def expire_stale(cls) -> int:
+        """
+        Marks every pending quote past its expiry date as expired, in a single UPDATE
+
+        Returns the number of quotes that were expired.
+        """
+        return cls.objects.filter(
+            status=cls.QuoteStatus.PENDING, expires_in__lt=timezone.now()
+        ).update(status=cls.QuoteStatus.EXPIRED)
 
     def truncate_quote_code(self) -> str:
         """
@@ -508,9 +826,14 @@ class Quote(models.Model):
         purchase_id = f"purchase_{truncated_quote_code}_{now.strftime('%Y%m%d%H%M%S')}"
 
         # store our new purchase quote that would be provided to external payment processors
+        #
+        # only the two purchase columns change, so we write just those, rather than
+        # saving the whole row
         self.purchase_id = purchase_id
         self.purchase_id_created_at = now
-        self.save()
+        type(self).objects.filter(pk=self.pk).update(
+            purchase_id=purchase_id, purchase_id_created_at=now
+        )
         return purchase_id
 
     def purchase_id_isvalid(self) -> bool:
@@ -534,7 +857,11 @@ class Quote(models.Model):
         if not self.quote_code:
             quote_code = generate_id(self.__class__)
             self.quote_code = quote_code
-        # Set quote expiry by default to 1 Month
+            # a freshly generated code cannot belong to an existing row, so go straight
+            # to the INSERT instead of letting Django probe with an UPDATE first
+            kwargs.setdefault("force_insert", True)
+        # the field default only applies on construction, so this covers quotes
+        # whose expiry was explicitly cleared
         if not self.expires_in:
-            self.expires_in = datetime.now() + timedelta(days=30)
+            self.expires_in = default_expiry_date()
         return super().save(*args, **kwargs)
@@ -0,0 +1,53 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.catalog.models import Product, ProductTier, lookup_cache_key
+
+
+@receiver(pre_save, sender=Product)
+def invalidate_renamed_product(sender, instance, **kwargs):
+    """
+    Evicts a product from the lookup cache under the name it is saved over,
+    so a renamed product can no longer be found by its previous name
+    """
+    if instance._state.adding:
+        return
+    previous = (
+        sender.objects.filter(pk=instance.pk).values_list("provider_id", "name").first()
+    )
+    if previous is not None:
+        cache.delete(lookup_cache_key("prod", *previous))
+
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_cached_product(sender, instance, **kwargs):
+    """
+    Evicts a product from the lookup cache whenever it is changed or removed
+    """
+    cache.delete(lookup_cache_key("prod", instance.provider_id, instance.name))
+
+
+@receiver(pre_save, sender=ProductTier)
+def invalidate_renamed_product_tier(sender, instance, **kwargs):
+    """
+    Evicts a product tier from the lookup cache under the name it is saved
+    over, so a renamed tier can no longer be found by its previous name
+    """
+    if instance._state.adding:
+        return
+    previous = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("product_id", "tier_name")
+        .first()
+    )
+    if previous is not None:
+        cache.delete(lookup_cache_key("tier", *previous))
+
+
+@receiver([post_save, post_delete], sender=ProductTier)
+def invalidate_cached_product_tier(sender, instance, **kwargs):
+    """
+    Evicts a product tier from the lookup cache whenever it is changed or removed
+    """
+    cache.delete(lookup_cache_key("tier", instance.product_id, instance.tier_name))
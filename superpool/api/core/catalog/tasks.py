@@ -0,0 +1,17 @@
+import logging
+
+from celery import shared_task
+
+from core.catalog.models import Quote
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def expire_stale_quotes() -> int:
+    """
+    Expires pending quotes that have outlived their expiry date
+    """
+    expired = Quote.expire_stale()
+    logger.info(f"Expired {expired} stale quotes")
+    return expired
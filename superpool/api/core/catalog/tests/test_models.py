@@ -0,0 +1,378 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.db.models import Sum
+from django.utils import timezone
+
+from api.catalog.tests.factories import (
+    PartnerFactory,
+    PolicyFactory,
+    PriceFactory,
+    ProductFactory,
+    QuoteFactory,
+)
+from api.merchants.tests.factories import MerchantFactory
+from core.catalog.models import (
+    Beneficiary,
+    Policy,
+    PolicyBeneficiary,
+    Price,
+    Product,
+    Quote,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def premium_fields():
+    """
+    Fields of a flat premium, with no discount or surcharges
+    """
+    return {
+        "amount": Decimal("100.00"),
+        "commision": Decimal("0.10"),
+        "discount_amount": None,
+        "surcharges": None,
+    }
+
+
+@pytest.fixture
+def premium(premium_fields):
+    return PriceFactory(**premium_fields)
+
+
+@pytest.fixture
+def product():
+    return ProductFactory()
+
+
+@pytest.mark.django_db
+def test_product_get_cached_serves_repeat_lookups_from_cache(
+    django_assert_num_queries, product
+):
+    with django_assert_num_queries(1):
+        Product.get_cached(product.provider_id, product.name)
+        cached = Product.get_cached(product.provider_id, product.name)
+
+    assert cached.pk == product.pk
+
+
+@pytest.mark.django_db
+def test_product_get_cached_is_invalidated_on_save(product):
+    Product.get_cached(product.provider_id, product.name)
+
+    product.description = "Updated description"
+    product.save()
+
+    cached = Product.get_cached(product.provider_id, product.name)
+    assert cached.description == "Updated description"
+
+
+@pytest.mark.django_db
+def test_product_get_cached_is_invalidated_on_rename():
+    product = ProductFactory(name="Old Name")
+    Product.get_cached(product.provider_id, "Old Name")
+
+    product.name = "New Name"
+    product.save()
+
+    with pytest.raises(Product.DoesNotExist):
+        Product.get_cached(product.provider_id, "Old Name")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "trash",
+    [
+        lambda product: product.trash(),
+        lambda product: Product.objects.filter(pk=product.pk).delete(),
+    ],
+    ids=["instance", "queryset"],
+)
+def test_product_get_cached_is_invalidated_on_trash_and_restore(trash, product):
+    Product.get_cached(product.provider_id, product.name)
+
+    trash(product)
+    assert Product.get_cached(product.provider_id, product.name).is_trashed
+
+    product.restore()
+    assert not Product.get_cached(product.provider_id, product.name).is_trashed
+
+
+@pytest.mark.django_db
+def test_product_get_cached_returns_newest_of_duplicate_names():
+    product = ProductFactory(name="Duplicate")
+    newer = ProductFactory(provider=product.provider, name="Duplicate")
+    Product.objects.filter(pk=newer.pk).update(
+        created_at=product.created_at + timedelta(minutes=1)
+    )
+
+    assert Product.get_cached(product.provider_id, "Duplicate").pk == newer.pk
+
+
+@pytest.mark.django_db
+def test_product_get_cached_raises_for_unknown_product(product):
+    with pytest.raises(Product.DoesNotExist):
+        Product.get_cached(product.provider_id, "Unknown Product")
+
+
+@pytest.mark.django_db
+def test_price_amounts_round_trip_through_minor_units():
+    price = Price.objects.create(
+        amount=Decimal("1250.50"),
+        discount_amount=Decimal("50.25"),
+        description="Standard premium",
+    )
+
+    price.refresh_from_db()
+
+    assert price.amount == Decimal("1250.50")
+    assert price.compute_total_price() == Decimal("1200.25")
+    assert Price.objects.filter(total_amount=Decimal("1200.25")).exists()
+    assert Price.objects.filter(amount__gte=Decimal("1250.50")).exists()
+    assert Price.objects.aggregate(total=Sum("amount"))["total"] == Decimal("1250.50")
+
+
+def test_price_compute_total_price_on_unsaved_price():
+    price = Price(amount=Decimal("10.00"), discount_amount=Decimal("1.00"))
+
+    assert price.compute_total_price() == Decimal("9.00")
+
+
+@pytest.mark.django_db
+def test_price_compute_total_price_reflects_saved_changes():
+    price = Price.objects.create(
+        amount=Decimal("10.00"),
+        discount_amount=Decimal("1.00"),
+        description="Changing premium",
+    )
+
+    price.amount = Decimal("20.00")
+    price.save()
+
+    assert price.compute_total_price() == Decimal("19.00")
+
+
+@pytest.mark.django_db
+def test_product_queryset_delete_trashes_rows():
+    products = ProductFactory.create_batch(2)
+
+    Product.objects.filter(pk__in=[product.pk for product in products]).delete()
+
+    assert Product.objects.filter(is_trashed=True).count() == 2
+    assert all(product.trashed_at for product in Product.objects.all())
+
+
+@pytest.mark.django_db
+def test_product_delete_trashes_single_row(product):
+    product.delete()
+
+    product.refresh_from_db()
+    assert product.is_trashed
+
+
+@pytest.mark.django_db
+def test_policy_stream_yields_named_rows():
+    merchant = MerchantFactory()
+    policies = PolicyFactory.create_batch(3, merchant_id=merchant.pk)
+
+    rows = list(
+        Policy.objects.filter(status=Policy.ACTIVE).stream(
+            "policy_id", "premium", chunk_size=2
+        )
+    )
+
+    assert {row.policy_id for row in rows} == {policy.pk for policy in policies}
+    assert all(isinstance(row.premium, Decimal) for row in rows)
+
+
+@pytest.mark.django_db
+def test_policy_attach_beneficiaries_inserts_links_once(django_assert_num_queries):
+    policy = PolicyFactory(merchant_id=MerchantFactory().pk)
+    beneficiaries = [
+        Beneficiary.objects.create(
+            first_name="Ada",
+            last_name="Obi",
+            email=f"beneficiary{index}@example.com",
+            phone_number="08012345678",
+        )
+        for index in range(3)
+    ]
+
+    with django_assert_num_queries(1):
+        policy.attach_beneficiaries(beneficiaries)
+    policy.attach_beneficiaries(beneficiaries[:1])
+
+    assert policy.beneficiaries.count() == 3
+
+
+@pytest.mark.django_db
+def test_beneficiary_email_can_be_reused_across_policies():
+    first_policy, second_policy = PolicyFactory.create_batch(2)
+    for policy in (first_policy, second_policy):
+        beneficiary = Beneficiary.objects.create(
+            first_name="Ada",
+            last_name="Obi",
+            email="ada@example.com",
+            phone_number="08012345678",
+        )
+        policy.beneficiaries.add(beneficiary)
+
+    assert (
+        PolicyBeneficiary.objects.filter(beneficiary__email="ada@example.com").count()
+        == 2
+    )
+
+
+@pytest.mark.django_db
+def test_policy_stats_by_provider_aggregates_in_the_database(
+    django_assert_num_queries,
+):
+    merchant = MerchantFactory()
+    provider = PartnerFactory(name="Stats Provider")
+    PolicyFactory(merchant_id=merchant.pk, provider=provider, premium=100)
+    PolicyFactory(
+        merchant_id=merchant.pk,
+        provider=provider,
+        premium=250,
+        status=Policy.CANCELLED,
+    )
+
+    with django_assert_num_queries(1):
+        stats = list(Policy.objects.stats_by_provider())
+
+    assert stats == [
+        {
+            "provider": provider.pk,
+            "total_premium": Decimal("350.00"),
+            "policy_count": 2,
+            "active_count": 1,
+        }
+    ]
+
+
+@pytest.mark.django_db
+def test_policy_ids_are_time_ordered():
+    merchant = MerchantFactory()
+    first, second = PolicyFactory.create_batch(2, merchant_id=merchant.pk)
+
+    assert first.policy_id.version == 7
+    assert first.policy_id.int >> 80 <= second.policy_id.int >> 80
+
+
+@pytest.mark.django_db
+def test_quote_expire_stale_only_expires_pending_quotes_past_expiry(premium_fields):
+    def create_quote(code, status, expires_in):
+        price = PriceFactory(**premium_fields, description=code)
+        return QuoteFactory(
+            quote_code=code, premium=price, status=status, expires_in=expires_in
+        )
+
+    yesterday = timezone.now() - timedelta(days=1)
+    stale = create_quote("Quo_stale", Quote.QuoteStatus.PENDING, yesterday)
+    accepted = create_quote("Quo_accepted", Quote.QuoteStatus.ACCEPTED, yesterday)
+    fresh = create_quote(
+        "Quo_fresh", Quote.QuoteStatus.PENDING, timezone.now() + timedelta(days=1)
+    )
+
+    assert Quote.expire_stale() == 1
+
+    for quote in (stale, accepted, fresh):
+        quote.refresh_from_db()
+    assert stale.status == Quote.QuoteStatus.EXPIRED
+    assert accepted.status == Quote.QuoteStatus.ACCEPTED
+    assert fresh.status == Quote.QuoteStatus.PENDING
+
+
+@pytest.mark.django_db
+def test_product_lite_defers_description(django_assert_num_queries, product):
+    with django_assert_num_queries(1):
+        product = Product.objects.lite().select_related("provider").get()
+        str(product)
+
+    assert product.get_deferred_fields() == {"description"}
+
+
+@pytest.mark.django_db
+def test_quote_generate_purchase_id_only_writes_purchase_columns(
+    django_assert_num_queries, premium
+):
+    quote = QuoteFactory(quote_code="Quo_abc_123", premium=premium)
+
+    with django_assert_num_queries(1):
+        purchase_id = quote.generate_purchase_id()
+
+    quote.refresh_from_db()
+    assert quote.purchase_id == purchase_id
+    assert quote.purchase_id_isvalid()
+
+
+def test_quote_cache_key_ignores_field_order():
+    first = Quote.cache_key({"product_type": "Gadget", "product_name": "Phone"}, None)
+    second = Quote.cache_key({"product_name": "Phone", "product_type": "Gadget"}, None)
+    other = Quote.cache_key({"product_type": "Travel"}, None)
+
+    assert first == second
+    assert first != other
+
+
+@pytest.mark.django_db
+def test_quote_bulk_ingest_assigns_codes_and_skips_conflicts(
+    django_assert_num_queries, product, premium
+):
+    rows = [
+        {"product": product, "premium": premium, "base_price": Decimal("100.00")}
+        for _ in range(3)
+    ]
+    rows.append({**rows[0], "quote_code": "Quo_existing"})
+    QuoteFactory(quote_code="Quo_existing", product=product, premium=premium)
+
+    with django_assert_num_queries(1):
+        quotes = Quote.bulk_ingest(rows)
+
+    assert all(quote.quote_code for quote in quotes)
+    assert Quote.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_quote_save_sets_an_aware_default_expiry(product, premium):
+    quote = Quote(
+        product=product,
+        premium=premium,
+        base_price=Decimal("100.00"),
+        expires_in=None,
+    )
+    quote.save()
+
+    assert timezone.is_aware(quote.expires_in)
+    assert quote.expires_in > timezone.now() + timedelta(days=29)
+
+
+@pytest.mark.django_db
+def test_price_amount_and_description_are_unique_together(premium_fields):
+    fields = {**premium_fields, "description": "Monthly premium"}
+    PriceFactory(**fields)
+
+    with pytest.raises(IntegrityError):
+        PriceFactory(**fields)
+
+
+@pytest.mark.django_db
+def test_quote_save_inserts_new_quotes_in_one_query(
+    django_assert_num_queries, product, premium
+):
+    quote = Quote(product=product, premium=premium, base_price=Decimal("100.00"))
+
+    with django_assert_num_queries(1):
+        quote.save()
+
+    assert Quote.objects.filter(quote_code=quote.quote_code).exists()
@@ -5,4 +5,6 @@ from core.claims.models import Claim
 
 @admin.register(Claim)
 class ClaimAdmin(admin.ModelAdmin):
-    pass
+    def get_queryset(self, request):
+        # rows are rendered with `Claim.__str__`, which reads the claimant's name
+        return super().get_queryset(request).with_claimants()
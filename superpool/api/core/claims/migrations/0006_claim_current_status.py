@@ -0,0 +1,62 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:28
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_current_status(apps, schema_editor):
+    """
+    Copies the latest status timeline entry of every claim onto the claim,
+    in a single UPDATE
+    """
+    Claim = apps.get_model("claims", "Claim")
+    StatusTimeline = apps.get_model("claims", "StatusTimeline")
+
+    timeline = StatusTimeline.objects.filter(claim=OuterRef("pk")).order_by(
+        "-timestamp"
+    )
+    Claim.objects.update(
+        current_status=Subquery(timeline.values("status")[:1]),
+        current_status_at=Subquery(timeline.values("timestamp")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0005_remove_claim_customer_claim_claimant_content_type_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="claim",
+            name="current_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("accepted", "Accepted"),
+                    ("approved", "Approved"),
+                    ("pending", "Pending"),
+                    ("denied", "Rejected"),
+                    ("paid", "Paid"),
+                    ("offer_sent", "Offer sent"),
+                    ("offer_accepted", "Offer accepted"),
+                ],
+                db_index=True,
+                help_text="Status of the latest entry in the claim's status timeline",
+                max_length=30,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="claim",
+            name="current_status_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                help_text="Time at which the latest status timeline entry was recorded",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_current_status, migrations.RunPython.noop),
+    ]
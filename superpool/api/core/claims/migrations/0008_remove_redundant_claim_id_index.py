@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:29
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0007_remove_redundant_claim_number_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="claim",
+            name="claim_id_idx",
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:42
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("catalog", "0033_price_unique_description_digest"),
+        ("claims", "0008_remove_redundant_claim_id_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="claim",
+            index=models.Index(
+                fields=["provider", "status", "-claim_date"],
+                name="claim_prov_stat_date_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="claim",
+            index=models.Index(
+                fields=["policy", "-claim_date"], name="claim_policy_date_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="claim",
+            index=models.Index(
+                fields=["claimant_content_type", "claimant_object_id"],
+                name="claim_claimant_gfk_idx",
+            ),
+        ),
+        # the single column foreign key indexes below are superseded by the indexes above
+        migrations.AlterField(
+            model_name="claim",
+            name="claimant_content_type",
+            field=models.ForeignKey(
+                db_index=False,
+                limit_choices_to={"model__in": ("customer", "beneficiary")},
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="contenttypes.contenttype",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="claim",
+            name="policy",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="claims",
+                to="catalog.policy",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="claim",
+            name="provider",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="core.provider",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:50
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("claims", "0009_claim_lookup_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="claim",
+            index=models.Index(
+                fields=["provider", "current_status", "-current_status_at"],
+                name="claim_prov_cur_status_idx",
+            ),
+        ),
+    ]
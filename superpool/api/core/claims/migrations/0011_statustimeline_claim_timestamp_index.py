@@ -0,0 +1,36 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:55
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("claims", "0010_claim_provider_current_status_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="statustimeline",
+            index=models.Index(
+                fields=["claim", "-timestamp"],
+                name="stl_claim_ts_idx",
+                include=["status"],
+            ),
+        ),
+        # superseded by the index above
+        migrations.AlterField(
+            model_name="statustimeline",
+            name="claim",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="claim_status_timeline",
+                to="claims.claim",
+            ),
+        ),
+    ]
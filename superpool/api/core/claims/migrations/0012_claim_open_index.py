@@ -0,0 +1,26 @@
+# Generated by Django 5.1.2 on 2026-10-18 08:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("claims", "0011_statustimeline_claim_timestamp_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="claim",
+            index=models.Index(
+                fields=["provider", "-claim_date"],
+                name="claim_open_idx",
+                condition=models.Q(
+                    status__in=("pending", "offer_sent", "offer_accepted")
+                ),
+            ),
+        ),
+    ]
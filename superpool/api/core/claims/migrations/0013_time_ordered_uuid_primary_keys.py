@@ -0,0 +1,35 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:52
+
+import core.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0012_claim_open_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="claim",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                verbose_name="Unique ID used internally to reference and identify claim objects",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="claimdocument",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
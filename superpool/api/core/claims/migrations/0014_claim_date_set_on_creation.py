@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0013_time_ordered_uuid_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="claim",
+            name="claim_date",
+            field=models.DateField(
+                auto_now_add=True,
+                db_index=True,
+                verbose_name="Date at which a claim is created",
+            ),
+        ),
+    ]
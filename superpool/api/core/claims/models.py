@@ -1,13 +1,116 @@
-import uuid
-
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from django.db import models
+from django.db.models import OuterRef, Prefetch, Q, Subquery
 from django.utils.translation import gettext_lazy as _
 
-from core.catalog.models import Policy, Product
+from core.catalog.models import Beneficiary, Policy, Product
 from core.mixins import TimestampMixin
 from core.providers.models import Provider
+from core.user.models import Customer
+from core.utils import generate_id, uuid7
+
+OPEN_CLAIM_STATUSES = ("pending", "offer_sent", "offer_accepted")
+""" Claim statuses that still need to be followed up on """
+
+
+class ClaimQuerySet(models.QuerySet):
+    def open(self) -> "ClaimQuerySet":
+        """
+        Restricts the queryset to claims that are still open, which is served by
+        the partial `claim_open_idx` index
+        """
+        return self.filter(status__in=OPEN_CLAIM_STATUSES)
+
+    def with_relations(self) -> "ClaimQuerySet":
+        """
+        Loads every relation rendered on claim endpoints up front, so serializing
+        a page of claims costs a fixed number of queries
+        """
+        return self.select_related(
+            "policy__provider", "provider", "product"
+        ).prefetch_related("claim_status_timeline")
+
+    def for_export(self, **filters) -> "ClaimQuerySet":
+        """
+        Narrows claims to the columns audit and report exports write out
+
+        Meant to be consumed with `.iterator(chunk_size=...)`, so rows are streamed
+        from a server-side cursor and memory stays bounded by the chunk size. Rows
+        are ordered by claim date, with the primary key breaking ties so the order
+        is stable across runs.
+        """
+        return (
+            self.filter(**filters)
+            .only("id", "claim_number", "claim_date", "amount", "status", "provider_id")
+            .order_by("claim_date", "pk")
+        )
+
+    def with_documents(self) -> "ClaimQuerySet":
+        """
+        Prefetches the documents uploaded for each claim, newest first
+
+        `claim_id` must stay among the loaded columns, since it is what the
+        documents are matched back to their claims with.
+        """
+        documents = ClaimDocument.objects.only(
+            "id",
+            "claim_id",
+            "evidence_type",
+            "document_name",
+            "document_url",
+            "uploaded_at",
+        ).order_by("-uploaded_at")
+        return self.prefetch_related(Prefetch("claim_documents", queryset=documents))
+
+    def with_claimants(self) -> "ClaimQuerySet":
+        """
+        Prefetches the claimant of each claim, with one query per claimant type,
+        so reading `Claim.claimant_name` afterwards does not hit the database
+        """
+        return self.prefetch_related(
+            GenericPrefetch(
+                "claimant",
+                [
+                    Customer.objects.only("id", "first_name", "last_name"),
+                    Beneficiary.objects.only(
+                        "id", "first_name", "middle_name", "last_name"
+                    ),
+                ],
+            )
+        )
+
+    def with_latest_status(self) -> "ClaimQuerySet":
+        """
+        Annotates each claim with the status and timestamp of its latest timeline entry
+
+        Both values are fetched in the same query as the claims, so reading
+        `Claim.latest_status` afterwards does not hit the database.
+        """
+        timeline = StatusTimeline.objects.filter(claim=OuterRef("pk")).order_by(
+            "-timestamp"
+        )
+        return self.annotate(
+            latest_status_value=Subquery(timeline.values("status")[:1]),
+            latest_status_at=Subquery(timeline.values("timestamp")[:1]),
+        )
+
+    def sync_current_status(self) -> int:
+        """
+        Reconciles `current_status` and `current_status_at` with each claim's
+        latest timeline entry
+
+        Runs as a single UPDATE in the database rather than loading the claims
+        and writing them back with `bulk_update`. Returns the number of claims updated.
+        """
+        timeline = StatusTimeline.objects.filter(claim=OuterRef("pk")).order_by(
+            "-timestamp"
+        )
+        return self.update(
+            current_status=Subquery(timeline.values("status")[:1]),
+            current_status_at=Subquery(timeline.values("timestamp")[:1]),
+        )
 
 
 class Claim(TimestampMixin, models.Model):
@@ -32,7 +135,7 @@ class Claim(TimestampMixin, models.Model):
 
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name=_(
             "Unique ID used internally to reference and identify claim objects"
@@ -48,7 +151,7 @@ class Claim(TimestampMixin, models.Model):
         ),
     )
     claim_date = models.DateField(
-        auto_now=True,
+        auto_now_add=True,
         db_index=True,
         verbose_name=_("Date at which a claim is created"),
     )
@@ -58,7 +161,10 @@ class Claim(TimestampMixin, models.Model):
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     estimated_loss = models.DecimalField(max_digits=10, decimal_places=2, null=True)
     payout_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True)
-    policy = models.ForeignKey(Policy, on_delete=models.CASCADE, related_name="claims")
+    # indexed by `claim_policy_date_idx`
+    policy = models.ForeignKey(
+        Policy, on_delete=models.CASCADE, related_name="claims", db_index=False
+    )
 
     # customer = models.ForeignKey(
     #     Customer, on_delete=models.CASCADE, related_name="claims"
@@ -76,12 +182,28 @@ class Claim(TimestampMixin, models.Model):
         on_delete=models.CASCADE,
         limit_choices_to={"model__in": ("customer", "beneficiary")},
         null=True,
+        db_index=False,
     )
     claimant_object_id = models.UUIDField(null=True)
     claimant = GenericForeignKey("claimant_content_type", "claimant_object_id")
 
     status = models.CharField(max_length=30, choices=CLAIM_STATUS, default="pending")
-    provider = models.ForeignKey(Provider, on_delete=models.CASCADE)
+    current_status = models.CharField(
+        max_length=30,
+        choices=CLAIM_STATUS,
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_("Status of the latest entry in the claim's status timeline"),
+    )
+    current_status_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_("Time at which the latest status timeline entry was recorded"),
+    )
+    # indexed by `claim_prov_stat_date_idx`
+    provider = models.ForeignKey(Provider, on_delete=models.CASCADE, db_index=False)
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     notes = models.TextField(null=True, blank=True)
     documents = models.ManyToManyField(
@@ -92,6 +214,8 @@ class Claim(TimestampMixin, models.Model):
         blank=True,
     )
 
+    objects = ClaimQuerySet.as_manager()
+
     class Meta:
         verbose_name = "claim"
         verbose_name_plural = "claims"
@@ -99,16 +223,67 @@ class Claim(TimestampMixin, models.Model):
         indexes = [
             # For performance reasons, we want to index the timestamps and claims number
             # as they would be used during audit processes
+            #
+            # `claim_number` and `id` are not listed, as their unique and primary key
+            # constraints already index them
             models.Index(fields=["created_at"], name="created_at_idx"),
-            models.Index(fields=["claim_number"], name="claim_number_idx"),
+            # the foreign keys below lead these indexes, so they carry no index of their own
+            models.Index(
+                fields=["provider", "status", "-claim_date"],
+                name="claim_prov_stat_date_idx",
+            ),
+            models.Index(
+                fields=["policy", "-claim_date"], name="claim_policy_date_idx"
+            ),
+            models.Index(
+                fields=["claimant_content_type", "claimant_object_id"],
+                name="claim_claimant_gfk_idx",
+            ),
             models.Index(
-                fields=["id"], name="claim_id_idx"
-            ),  # pronounced claim id index
+                fields=["provider", "current_status", "-current_status_at"],
+                name="claim_prov_cur_status_idx",
+            ),
+            # dashboards only follow up on claims that are still open, so we keep a
+            # smaller index over just those rows
+            models.Index(
+                fields=["provider", "-claim_date"],
+                name="claim_open_idx",
+                condition=Q(status__in=OPEN_CLAIM_STATUSES),
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.id} - {self.claimant_name}"
 
+    @classmethod
+    def bulk_ingest(cls, rows: list[dict], batch_size: int = 1000) -> list["Claim"]:
+        """
+        Creates claims from a list of field values in batched INSERTs
+
+        Claims without a claim number are assigned one, and rows that conflict
+        with existing claims are skipped.
+        """
+        claims = [cls(**row) for row in rows]
+        for claim in claims:
+            if not claim.claim_number:
+                claim.claim_number = generate_id(cls)
+        return cls.objects.bulk_create(
+            claims, batch_size=batch_size, ignore_conflicts=True
+        )
+
+    def set_claimant(self, claimant: Customer | Beneficiary) -> None:
+        """
+        Sets the claimant along with its matching claimant type
+
+        Content types are cached per process by `ContentType.objects.get_for_model`,
+        so only the first claimant of each type costs a query.
+        """
+        if isinstance(claimant, Customer):
+            self.claimant_type = self.ClaimantType.CUSTOMER
+        else:
+            self.claimant_type = self.ClaimantType.BENEFICIARY
+        self.claimant = claimant
+
     @property
     def claimant_name(self):
         """
@@ -125,12 +300,24 @@ class Claim(TimestampMixin, models.Model):
                     return f"{self.claimant.first_name} {self.claimant.last_name}"
 
     @property
-    def latest_status(self):
+    def latest_status(self) -> str | None:
         """
         Provides latest information regarding a claim status
+
+        Uses the value annotated by `Claim.objects.with_latest_status()` or the
+        denormalized `current_status` when present, otherwise falls back to
+        querying the status timeline.
         """
+        if hasattr(self, "latest_status_value"):
+            return self.latest_status_value
+        if self.current_status is not None:
+            return self.current_status
         # retrieves a set from the StatusTimeline class, ordering by latest timestamp
-        return self.statustimeline_set.order_by("-timestamp").first()
+        return (
+            self.claim_status_timeline.order_by("-timestamp")
+            .values_list("status", flat=True)
+            .first()
+        )
 
 
 class StatusTimeline(models.Model):
@@ -140,12 +327,37 @@ class StatusTimeline(models.Model):
     Stores the new status and the timestamp when the change occurred.
     """
 
+    # indexed by `stl_claim_ts_idx`
     claim = models.ForeignKey(
-        Claim, on_delete=models.CASCADE, related_name="claim_status_timeline"
+        Claim,
+        on_delete=models.CASCADE,
+        related_name="claim_status_timeline",
+        db_index=False,
     )
     status = models.CharField(max_length=30, choices=Claim.CLAIM_STATUS)
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # serves "latest status of a claim" lookups; on PostgreSQL the status is
+            # included in the index, so those are answered without visiting the table
+            models.Index(
+                fields=["claim", "-timestamp"],
+                name="stl_claim_ts_idx",
+                include=["status"],
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # keep the claim's denormalized status in step with its latest timeline entry;
+        # re-saving an older entry must not roll the claim back to a stale status
+        Claim.objects.filter(
+            Q(current_status_at__isnull=True)
+            | Q(current_status_at__lte=self.timestamp),
+            pk=self.claim_id,
+        ).update(current_status=self.status, current_status_at=self.timestamp)
+
 
 class ClaimDocument(models.Model):
     """
@@ -166,7 +378,7 @@ class ClaimDocument(models.Model):
 
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     claim = models.ForeignKey(
@@ -202,7 +414,8 @@ class ClaimDocument(models.Model):
         ordering = ["-uploaded_at"]
 
     def __str__(self) -> str:
-        return f"{self.document_name} for claim #{self.claim.claim_number} if {self.claim.claim_number} else {self.claim.id}"
+        # `claim_id` is already loaded with the row, unlike the claim itself
+        return f"{self.document_name} for claim #{self.claim_id}"
 
     @property
     def download_url(self):
@@ -0,0 +1,213 @@
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from api.claims.tests.factories import ClaimFactory
+from core.catalog.models import Beneficiary
+from core.claims.models import Claim, ClaimDocument, StatusTimeline
+
+
+@pytest.mark.django_db
+def test_with_latest_status_annotates_latest_timeline_entry(
+    django_assert_num_queries,
+):
+    claim = ClaimFactory()
+    StatusTimeline.objects.create(claim=claim, status="pending")
+    StatusTimeline.objects.create(claim=claim, status="approved")
+
+    with django_assert_num_queries(1):
+        annotated = Claim.objects.with_latest_status().get(pk=claim.pk)
+        latest_status = annotated.latest_status
+
+    assert latest_status == "approved"
+    assert annotated.latest_status_at is not None
+
+
+@pytest.mark.django_db
+def test_latest_status_falls_back_to_the_status_timeline():
+    claim = ClaimFactory()
+    # bulk_create skips `save()`, so the claim's current status is never set
+    StatusTimeline.objects.bulk_create([StatusTimeline(claim=claim, status="pending")])
+
+    assert Claim.objects.get(pk=claim.pk).latest_status == "pending"
+
+
+@pytest.mark.django_db
+def test_status_timeline_entries_update_the_claims_current_status():
+    claim = ClaimFactory()
+    StatusTimeline.objects.create(claim=claim, status="pending")
+    entry = StatusTimeline.objects.create(claim=claim, status="offer_sent")
+
+    claim.refresh_from_db()
+
+    assert claim.current_status == "offer_sent"
+    assert claim.current_status_at == entry.timestamp
+    assert claim.latest_status == "offer_sent"
+
+
+@pytest.mark.django_db
+def test_resaving_an_older_timeline_entry_keeps_the_claims_current_status():
+    claim = ClaimFactory()
+    older = StatusTimeline.objects.create(claim=claim, status="pending")
+    latest = StatusTimeline.objects.create(claim=claim, status="offer_sent")
+
+    older.status = "approved"
+    older.save()
+    claim.refresh_from_db()
+
+    assert claim.current_status == "offer_sent"
+    assert claim.current_status_at == latest.timestamp
+
+
+@pytest.mark.django_db
+def test_claim_bulk_ingest_assigns_claim_numbers(django_assert_num_queries):
+    claim = ClaimFactory()
+    rows = [
+        {
+            "policy": claim.policy,
+            "provider": claim.provider,
+            "product": claim.product,
+            "amount": claim.amount,
+        }
+        for _ in range(2)
+    ]
+
+    with django_assert_num_queries(1):
+        Claim.bulk_ingest(rows, batch_size=10)
+
+    claim_numbers = Claim.objects.exclude(pk=claim.pk).values_list(
+        "claim_number", flat=True
+    )
+    assert len(set(claim_numbers)) == 2
+    assert all(number.startswith("Cla_") for number in claim_numbers)
+
+
+@pytest.mark.django_db
+def test_sync_current_status_reconciles_claims_in_one_query(
+    django_assert_num_queries,
+):
+    claims = ClaimFactory.create_batch(2)
+    StatusTimeline.objects.bulk_create(
+        [StatusTimeline(claim=claim, status="approved") for claim in claims]
+    )
+
+    with django_assert_num_queries(1):
+        assert Claim.objects.sync_current_status() == 2
+
+    assert set(Claim.objects.values_list("current_status", flat=True)) == {"approved"}
+
+
+@pytest.mark.django_db
+def test_with_relations_loads_claim_relations_up_front(django_assert_num_queries):
+    for claim in ClaimFactory.create_batch(3):
+        StatusTimeline.objects.create(claim=claim, status="pending")
+
+    # one query for the claims and their foreign keys, one for the timelines
+    with django_assert_num_queries(2):
+        for claim in Claim.objects.with_relations():
+            claim.policy.provider.name, claim.provider.name, claim.product.name
+            list(claim.claim_status_timeline.all())
+
+
+@pytest.mark.django_db
+def test_with_claimants_prefetches_claimants(django_assert_num_queries):
+    ClaimFactory.create_batch(3, claimant_type=Claim.ClaimantType.CUSTOMER)
+    # content types are cached for the lifetime of the process
+    ContentType.objects.get_for_model(Beneficiary)
+
+    # one query for the claims, one for their customers
+    with django_assert_num_queries(2):
+        names = [claim.claimant_name for claim in Claim.objects.with_claimants()]
+
+    assert all(names)
+
+
+@pytest.mark.django_db
+def test_open_only_returns_claims_that_are_still_open():
+    pending = ClaimFactory(status="pending")
+    ClaimFactory(status="paid")
+
+    assert list(Claim.objects.open()) == [pending]
+
+
+def test_claim_and_document_ids_are_time_ordered():
+    assert Claim().id.version == 7
+    assert ClaimDocument().id.version == 7
+
+
+@pytest.mark.django_db
+def test_for_export_streams_only_the_exported_columns():
+    claim = ClaimFactory(status="paid")
+    ClaimFactory(status="pending")
+
+    (exported,) = Claim.objects.for_export(status="paid").iterator(chunk_size=100)
+
+    assert exported.pk == claim.pk
+    assert "notes" in exported.get_deferred_fields()
+
+
+@pytest.mark.django_db
+def test_for_export_orders_claims_by_claim_date():
+    later = ClaimFactory()
+    earlier = ClaimFactory()
+    Claim.objects.filter(pk=later.pk).update(claim_date="2024-02-01")
+    Claim.objects.filter(pk=earlier.pk).update(claim_date="2024-01-01")
+
+    exported = Claim.objects.for_export().iterator(chunk_size=100)
+
+    assert [claim.pk for claim in exported] == [earlier.pk, later.pk]
+
+
+@pytest.mark.django_db
+def test_claim_date_is_not_rewritten_on_update():
+    claim = ClaimFactory()
+    Claim.objects.filter(pk=claim.pk).update(claim_date="2024-01-01")
+    claim.refresh_from_db()
+
+    claim.notes = "Followed up with the claimant"
+    claim.save()
+    claim.refresh_from_db()
+
+    assert str(claim.claim_date) == "2024-01-01"
+
+
+@pytest.mark.django_db
+def test_set_claimant_sets_the_matching_claimant_type():
+    claim = ClaimFactory(claimant_type=Claim.ClaimantType.CUSTOMER)
+    beneficiary = Beneficiary.objects.create(
+        first_name="Ada",
+        last_name="Obi",
+        email="ada@example.com",
+        phone_number="08012345678",
+    )
+
+    claim.set_claimant(beneficiary)
+
+    assert claim.claimant_type == Claim.ClaimantType.BENEFICIARY
+    assert claim.claimant_object_id == beneficiary.pk
+    assert claim.claimant_name == "Ada Obi"
+
+
+@pytest.mark.django_db
+def test_claim_document_str_does_not_load_the_claim(django_assert_num_queries):
+    claim = ClaimFactory()
+    ClaimDocument.objects.create(
+        claim=claim, evidence_type=ClaimDocument.PICTURE, document_name="Receipt"
+    )
+    document = ClaimDocument.objects.get()
+
+    with django_assert_num_queries(0):
+        assert str(document) == f"Receipt for claim #{claim.pk}"
+
+
+@pytest.mark.django_db
+def test_with_documents_prefetches_claim_documents(django_assert_num_queries):
+    for claim in ClaimFactory.create_batch(3):
+        ClaimDocument.objects.create(
+            claim=claim, evidence_type=ClaimDocument.PICTURE, document_name="Receipt"
+        )
+
+    # one query for the claims, one for their documents
+    with django_assert_num_queries(2):
+        for claim in Claim.objects.with_documents():
+            (document,) = claim.claim_documents.all()
+            document.document_name, document.document_url, document.uploaded_at
@@ -2,14 +2,75 @@ from typing import Any, Union
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.utils.translation import gettext as _
 
 from core.merchants.models import Merchant
+from core.tasks import send_email
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
 
 _EmailType = Union[str, list[str]]
 
+LXML_MIN_HTML_LENGTH = 256
+""" Below this size, `strip_tags` is cheaper than setting up an lxml parse """
+
+
+def _serialize_email(message: EmailMultiAlternatives) -> dict[str, Any]:
+    """
+    Serializes an email message into the arguments `core.tasks.send_email` expects
+    """
+    return {
+        "subject": message.subject,
+        "body": message.body,
+        "from_email": message.from_email,
+        "to": message.to,
+        "cc": message.cc,
+        "bcc": message.bcc,
+        "reply_to": message.reply_to,
+        "headers": message.extra_headers,
+        "alternatives": [
+            [content, mimetype] for content, mimetype in message.alternatives
+        ],
+    }
+
+
+def _send_on_commit(message: EmailMultiAlternatives) -> None:
+    """
+    Queues an email message for a background worker once the current
+    transaction commits
+    """
+    serialized = _serialize_email(message)
+    transaction.on_commit(lambda: send_email.delay(serialized))
+
+
+def _send(message: EmailMultiAlternatives) -> None:
+    """
+    Sends an email message right away, or through the background worker when
+    `SUPERPOOL_SEND_EMAILS_ASYNC` is enabled
+    """
+    if settings.SUPERPOOL_SEND_EMAILS_ASYNC:
+        _send_on_commit(message)
+    else:
+        message.send(fail_silently=False)
+
+
+def _html_to_text(html_content: str) -> str:
+    """
+    Derives the plain text body of an email from its HTML content
+
+    Uses lxml's parser when it is installed, which walks the document once in C
+    instead of repeatedly running `strip_tags`'s regular expressions over it.
+    """
+    if lxml_html is None or len(html_content) < LXML_MIN_HTML_LENGTH:
+        return strip_tags(html_content)
+    return lxml_html.fromstring(html_content).text_content()
+
 
 class BaseEmailMessage(EmailMultiAlternatives):
     """
@@ -60,7 +121,7 @@ class BaseEmailMessage(EmailMultiAlternatives):
         html_content = self.render_template(context)
 
         self.attach_alternative(html_content, "text/html")
-        self.body = strip_tags(html_content)
+        self.body = _html_to_text(html_content)
 
         # Set any other additional attributes
         if extra_kwargs:
@@ -91,11 +152,25 @@ class BaseEmailMessage(EmailMultiAlternatives):
         """
         return settings.DEFAULT_FROM_EMAIL
 
-    def send(self, silent: bool = True) -> None:
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the message, so it can be handed over to a background worker
+        """
+        return _serialize_email(self)
+
+    def send(self, fail_silently: bool = False) -> None:
         """
         Send email message to the user
+
+        When `SUPERPOOL_SEND_EMAILS_ASYNC` is enabled, the message is delivered by a
+        background worker once the current transaction commits, so the request does
+        not wait on the SMTP server. Delivery failures are then retried by the
+        worker rather than raised here.
         """
-        super().send(fail_silently=False)
+        if settings.SUPERPOOL_SEND_EMAILS_ASYNC:
+            _send_on_commit(self)
+        else:
+            super().send(fail_silently=fail_silently)
 
 
 class PendingVerificationEmail(BaseEmailMessage):
@@ -188,7 +263,7 @@ def send_password_reset_email(
         to=[merchant_email],
     )
     reset_email.attach_alternative(html_content, "text/html")
-    reset_email.send()
+    _send(reset_email)
 
 
 def send_password_reset_confirm_email(merchant: Merchant) -> None:
@@ -208,4 +283,4 @@ def send_password_reset_confirm_email(merchant: Merchant) -> None:
         to=[merchant_email],
     )
     reset_confirmation_email.attach_alternative(html_content, "text/html")
-    reset_confirmation_email.send()
+    _send(reset_confirmation_email)
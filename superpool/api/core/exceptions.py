@@ -1,4 +1,4 @@
-class BaseException(Exception):
+class PlatformBaseException(Exception):
     """
     Base class for platform-specific exceptions
     """
@@ -6,9 +6,6 @@ class BaseException(Exception):
     def __init__(
         self, message: str | None = None, code: str | int | None = None
     ) -> None:
-        if code:
-            self.code = code
+        super().__init__(message)
         self.message = message
-
-    def __new__(cls) -> BaseException:
-        return super().__new__(self.message, self.code)
+        self.code = code
@@ -0,0 +1,43 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import models
+
+
+class MinorUnitAmountField(models.DecimalField):
+    """
+    Monetary amount stored as an integer count of the currency's minor unit
+
+    e.g 1250.50 NGN is persisted as 125050 (kobo) in a `bigint` column, which is
+    smaller and cheaper to aggregate than a variable-length `numeric`.
+
+    The field still behaves like a `DecimalField` everywhere else: values are
+    exposed to Python as `Decimal`, lookups and filters accept major units, and
+    serializers map it to a `DecimalField` using `max_digits`/`decimal_places`.
+    """
+
+    def get_internal_type(self) -> str:
+        return "BigIntegerField"
+
+    def to_minor_units(self, value: Decimal) -> int:
+        """
+        Converts a major unit amount into its minor unit representation
+        """
+        return int((value.scaleb(self.decimal_places)).to_integral_value(ROUND_HALF_UP))
+
+    def from_minor_units(self, value: int) -> Decimal:
+        """
+        Converts a minor unit amount back into its major unit representation
+        """
+        return Decimal(value).scaleb(-self.decimal_places)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None or hasattr(value, "as_sql"):
+            return value
+        return self.to_minor_units(self.to_python(value))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.from_minor_units(value)
@@ -1,7 +1,9 @@
 import random
 from datetime import timedelta
+from decimal import Decimal
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 
 from core.catalog.models import Price, Product, Quote
@@ -11,6 +13,7 @@ from core.providers.models import Provider as InsuranceProvider
 class Command(BaseCommand):
     help = "Create sample quotes for products"
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         provider, _ = InsuranceProvider.objects.get_or_create(
             name="AIICO",
@@ -56,28 +59,85 @@ class Command(BaseCommand):
             },
         ]
 
-        for product_data in products_data:
-            product, _ = Product.objects.get_or_create(
-                name=product_data["name"],
-                product_type=product_data["product_type"],
-                description=product_data["description"],
-                provider=provider,
+        # every table is written with a single INSERT, and rows left over from a
+        # previous run are skipped rather than looked up one by one
+        product_names = [product_data["name"] for product_data in products_data]
+        existing_products = set(
+            Product.objects.filter(
+                provider=provider, name__in=product_names
+            ).values_list("name", flat=True)
+        )
+        Product.objects.bulk_create(
+            [
+                Product(
+                    name=product_data["name"],
+                    product_type=product_data["product_type"],
+                    description=product_data["description"],
+                    provider=provider,
+                )
+                for product_data in products_data
+                if product_data["name"] not in existing_products
+            ]
+        )
+        products = {
+            product.name: product
+            for product in Product.objects.filter(
+                provider=provider, name__in=product_names
             )
+        }
 
-            price, _ = Price.objects.get_or_create(
-                amount=product_data["premium_amount"],
-                description=f"Standard {product_data['product_type'].lower()} insurance premium",
+        for product_data in products_data:
+            product_data["price_description"] = (
+                f"Standard {product_data['product_type'].lower()} insurance premium"
+            )
+        Price.objects.bulk_create(
+            [
+                Price(
+                    amount=product_data["premium_amount"],
+                    description=product_data["price_description"],
+                )
+                for product_data in products_data
+            ],
+            ignore_conflicts=True,
+        )
+        prices = {
+            (price.amount, price.description): price
+            for price in Price.objects.filter(
+                description__in=[
+                    product_data["price_description"] for product_data in products_data
+                ]
             )
+        }
 
-            Quote.objects.get_or_create(
-                product=product,
-                # quote_code=f"Q{product_data['product_type'][0]}001",
-                defaults={
+        quoted_products = set(
+            Quote.objects.filter(product__in=products.values()).values_list(
+                "product_id", flat=True
+            )
+        )
+        unquoted_products_data = [
+            product_data
+            for product_data in products_data
+            if products[product_data["name"]].pk not in quoted_products
+        ]
+        statuses = random.choices(
+            ["pending", "accepted", "declined"], k=len(unquoted_products_data)
+        )
+        Quote.bulk_ingest(
+            [
+                {
+                    "product": products[product_data["name"]],
                     "base_price": product_data["base_price"],
-                    "premium": price,
+                    "premium": prices[
+                        (
+                            Decimal(str(product_data["premium_amount"])),
+                            product_data["price_description"],
+                        )
+                    ],
                     "expires_in": timezone.now() + timedelta(days=30),
-                    "status": random.choice(["pending", "accepted", "declined"]),
-                },
-            )
+                    "status": status,
+                }
+                for product_data, status in zip(unquoted_products_data, statuses)
+            ]
+        )
 
-        print("Successfully created all quotes")
+        self.stdout.write(self.style.SUCCESS("Successfully created all quotes"))
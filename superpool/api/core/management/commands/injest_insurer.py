@@ -14,6 +14,7 @@ from textwrap import dedent
 from typing import Any
 
 import requests
+from django.conf import settings
 from django.core.management import BaseCommand
 from django.core.management.base import CommandError, CommandParser
 from django.db import transaction
@@ -22,6 +23,41 @@ from core.catalog.models import Product, ProductTier
 from core.models import Coverage
 from core.providers.models import Provider
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PRODUCT_TYPE_KEYWORDS = (
+    ("Life", Product.ProductType.LIFE),
+    ("Health", Product.ProductType.HEALTH),
+    ("Auto", Product.ProductType.AUTO),
+    ("Travel", Product.ProductType.TRAVEL),
+    ("Gadget", Product.ProductType.GADGET),
+    ("Home", Product.ProductType.HOME),
+    ("Personal Accident", Product.ProductType.PERSONAL_ACCIDENT),
+    ("Student Protection", Product.ProductType.STUDENT_PROTECTION),
+)
+"""
+Keywords looked for in a product name, in order of precedence, and the product
+type they map to
+"""
+
+TIER_TYPE_KEYWORDS = (
+    ("Basic", ProductTier.TierType.BASIC),
+    ("Standard", ProductTier.TierType.STANDARD),
+    ("Premium", ProductTier.TierType.PREMIUM),
+    ("Bronze", ProductTier.TierType.BRONZE),
+    ("Silver", ProductTier.TierType.SILVER),
+)
+"""
+Keywords looked for in a tier type, in order of precedence, and the tier type
+they map to
+"""
+
+COVERAGE_TYPE_VALUES = frozenset(Coverage.CoverageType.values)
+""" `CoverageType.values` builds a new list on every access """
+
 
 class Command(BaseCommand):
     """
@@ -49,6 +85,10 @@ class Command(BaseCommand):
             python manage.py ingest_insurer --url=https://example.com/insurer_data.json
 
         Ensure that only one of --path or --url is provided at a time.
+
+        New products, tiers and coverages are inserted in batches of
+        SUPERPOOL_BULK_CREATE_BATCH_SIZE rows (100 by default), which can be
+        set in the environment.
         """
     )
 
@@ -63,51 +103,47 @@ class Command(BaseCommand):
             type=str,
             help="URL Path containing the json file with the insurers information",
         )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Do not prompt the user for input of any kind",
+        )
+        parser.add_argument(
+            "--update-email",
+            action="store_true",
+            help="Update the insurer's support email without prompting when it differs from our records",
+        )
 
     def _map_product_type(self, product_name: str):
         """
         Map a product name to the appropriate ProductType.
         """
-        if "Life" in product_name:
-            return Product.ProductType.LIFE
-        elif "Health" in product_name:
-            return Product.ProductType.HEALTH
-        elif "Auto" in product_name:
-            return Product.ProductType.AUTO
-        elif "Travel" in product_name:
-            return Product.ProductType.TRAVEL
-        elif "Gadget" in product_name:
-            return Product.ProductType.GADGET
-        elif "Home" in product_name:
-            return Product.ProductType.HOME
-        elif "Personal Accident" in product_name:
-            return Product.ProductType.PERSONAL_ACCIDENT
-        elif "Student Protection" in product_name:
-            return Product.ProductType.STUDENT_PROTECTION
-        else:
-            return Product.ProductType.OTHER
+        for keyword, product_type in PRODUCT_TYPE_KEYWORDS:
+            if keyword in product_name:
+                return product_type
+        return Product.ProductType.OTHER
 
     def _map_tier_type(self, tier_name: str):
         """
         Map a tier type to the appropriate TierType.
         """
-        if "Basic" in tier_name:
-            return ProductTier.TierType.BASIC
-        elif "Standard" in tier_name:
-            return ProductTier.TierType.STANDARD
-        elif "Premium" in tier_name:
-            return ProductTier.TierType.PREMIUM
-        elif "Bronze" in tier_name:
-            return ProductTier.TierType.BRONZE
-        elif "Silver" in tier_name:
-            return ProductTier.TierType.SILVER
-        else:
-            return ProductTier.TierType.OTHER
+        for keyword, tier_type in TIER_TYPE_KEYWORDS:
+            if keyword in tier_name:
+                return tier_type
+        return ProductTier.TierType.OTHER
 
     def _read_from_file_path(self, file_path: Path):
         """
         Read JSON file from file path
+
+        Parses with orjson when it is installed, falling back to the standard
+        library's `json` module otherwise.
         """
+        if orjson is not None:
+            with open(file_path, "rb") as filebuf:
+                return orjson.loads(filebuf.read())
         with open(file_path, encoding="utf-8") as filebuf:
             return json.load(filebuf)
 
@@ -118,11 +154,23 @@ class Command(BaseCommand):
         try:
             response = requests.get(url, timeout=10)
             response.raise_for_status()  # raise exception is we have errors
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
-        except requests.RequestException as netioerr:
+        # both JSON decoders raise a `ValueError` subclass on malformed documents
+        except (requests.RequestException, ValueError) as netioerr:
             return CommandError(f"Failed to fetch data from {url}: {netioerr}")
 
+    def _write_detail(self, message: str) -> None:
+        """
+        Writes a per-row progress message, which is only shown at a verbosity of
+        2 or more so that large catalogues are not slowed down by console output
+        """
+        if self.verbosity >= 2:
+            self.stdout.write(message)
+
     def handle(self, *args: Any, **options: Any) -> str | None:
+        self.verbosity = options.get("verbosity", 1)
         json_file_path = options.get("path")
         json_url = options.get("url")
 
@@ -149,52 +197,63 @@ class Command(BaseCommand):
                 "Cannot parse file information. error: INVALID_INSURER_INFO"
             )
 
-        provider, created = Provider.objects.get_or_create(name=insurer_name)
-
-        if not created:
-            if provider.support_email != insurer_email:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"The provided insurer's email differ from what we have on our records."
-                        f"Found, {provider.support_email} instead of the newly provided {insurer_email}."
-                        "Would you like to update it with the provided one? "
-                    )
-                )
-
-                email_prompt = input(
+        # settle any prompts before opening the transaction, so it is never held
+        # open while waiting on the user
+        update_email = options["update_email"]
+        provider = Provider.objects.filter(name=insurer_name).first()
+        if (
+            options["interactive"]
+            and not update_email
+            and provider
+            and provider.support_email != insurer_email
+        ):
+            self.stdout.write(
+                self.style.WARNING(
+                    f"The provided insurer's email differ from what we have on our records."
+                    f"Found, {provider.support_email} instead of the newly provided {insurer_email}."
                     "Would you like to update it with the provided one? "
                 )
+            )
 
-                match email_prompt:
-                    case "y" | "Y":
-                        provider.support_email = insurer_email
-                        provider.save()
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f"Updated email for {insurer_name} to {insurer_email}"
-                            )
-                        )
-                    case "n" | "N":
-                        sys.stdout.write(
-                            self.style.NOTICE("Understood! Skipping to next process...")
-                        )
-                    case _:
-                        pass
+            email_prompt = input("Would you like to update it with the provided one? ")
 
-        else:
-            provider.support_email = insurer_email
-            provider.support_phone = insurer_phone
-            provider.save()
-            self.stdout.write(
-                f"Created new insurer: {insurer_name} with email {insurer_email}."
+            match email_prompt:
+                case "y" | "Y":
+                    update_email = True
+                case "n" | "N":
+                    sys.stdout.write(
+                        self.style.NOTICE("Understood! Skipping to next process...")
+                    )
+                case _:
+                    pass
+
+        # the whole ingest is committed at once, rather than once per saved row
+        with transaction.atomic():
+            provider, created = Provider.objects.get_or_create(
+                name=insurer_name,
+                defaults={
+                    "support_email": insurer_email,
+                    "support_phone": insurer_phone,
+                },
             )
 
-        self.stdout.write(f"Detected provider: {provider.name}")
+            if created:
+                self.stdout.write(
+                    f"Created new insurer: {insurer_name} with email {insurer_email}."
+                )
+            elif update_email and provider.support_email != insurer_email:
+                provider.support_email = insurer_email
+                provider.save(update_fields=["support_email"])
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Updated email for {insurer_name} to {insurer_email}"
+                    )
+                )
+
+            self.stdout.write(f"Detected provider: {provider.name}")
 
-        with transaction.atomic():
             # Process each product and product tiers
-            for product_data in insurer_data["products"]:
-                self._process_product(provider, product_data)
+            self._process_products(provider, insurer_data["products"])
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -202,130 +261,174 @@ class Command(BaseCommand):
             )
         )
 
-    def _process_product(self, provider, product_data):
+    def _process_products(self, provider, products_data):
         """
-        Create or update a product for the given provider.
+        Create the given products and their tiers for the provider, where they
+        do not exist yet.
         """
+        # existing products and tiers are loaded up front and the missing ones
+        # inserted in bulk, rather than with a round trip per row
+        products = {
+            product.name: product
+            for product in Product.objects.filter(
+                provider=provider,
+                name__in=[product_data["name"] for product_data in products_data],
+            )
+        }
+        tiers = {
+            (tier.product_id, tier.tier_name): tier
+            for tier in ProductTier.objects.filter(product__in=products.values())
+        }
+
+        new_products = []
+        for product_data in products_data:
+            product_name = product_data["name"]
+            if product_name in products:
+                self._write_detail(
+                    self.style.NOTICE(f"Product {product_name} already exists")
+                )
+                continue
 
-        product_name = product_data["name"]
-        product_description = product_data.get("description", "")
-
-        product_type = self._map_product_type(product_name)
-
-        # handle product creation
-        product, product_created = Product.objects.get_or_create(
-            provider=provider,
-            name=product_name,
-            defaults={
-                "description": product_description,
-                "product_type": product_type,
-            },
-        )
-
-        if product_created:
-            self.stdout.write(
-                self.style.SUCCESS(f"Created new product: {product_name}")
+            product = Product(
+                provider=provider,
+                name=product_name,
+                description=product_data.get("description", ""),
+                product_type=self._map_product_type(product_name),
             )
-        else:
-            self.stdout.write(
-                self.style.NOTICE(f"Product {product_name} already exists")
+            products[product_name] = product
+            new_products.append(product)
+            self._write_detail(
+                self.style.SUCCESS(f"Created new product: {product_name}")
             )
+        Product.objects.bulk_create(
+            new_products, batch_size=settings.SUPERPOOL_BULK_CREATE_BATCH_SIZE
+        )
 
-        for tier_data in product_data["tiers"]:
-            self._process_tier(product, tier_data)
+        new_tiers = []
+        tiers_data = []
+        for product_data in products_data:
+            product = products[product_data["name"]]
+            for tier_data in product_data["tiers"]:
+                tier_name = tier_data["tier_name"]
+                tier = tiers.get((product.pk, tier_name))
+                if tier is not None:
+                    self._write_detail(
+                        self.style.NOTICE(
+                            f"Tier '{tier_name}' already exists for product '{product.name}'."
+                        )
+                    )
+                else:
+                    tier = ProductTier(
+                        product=product,
+                        tier_name=tier_name,
+                        base_premium=Decimal(tier_data["pricing"]["base_premium"]),
+                        description=tier_data.get("description", ""),
+                        tier_type=self._map_tier_type(
+                            tier_data.get("tier_type", "Other")
+                        ),
+                    )
+                    tiers[(product.pk, tier_name)] = tier
+                    new_tiers.append(tier)
+                    self._write_detail(
+                        self.style.SUCCESS(
+                            f"Created tier '{tier_name}' for product '{product.name}'."
+                        )
+                    )
+                tiers_data.append((tier, tier_data))
+        ProductTier.objects.bulk_create(
+            new_tiers, batch_size=settings.SUPERPOOL_BULK_CREATE_BATCH_SIZE
+        )
 
-    def _process_tier(self, product, tier_data):
-        """
-        Create or update a product tier for the given product.
-        """
-        tier_name = tier_data["tier_name"]
-        tier_pricing = tier_data["pricing"]
-        base_premium = Decimal(tier_pricing["base_premium"])
-        _tier_type = tier_data.get("tier_type", "Other")
-
-        tier_type = self._map_tier_type(_tier_type)
-
-        tier, tier_created = ProductTier.objects.get_or_create(
-            product=product,
-            tier_name=tier_name,
-            defaults={
-                "base_premium": base_premium,
-                "description": tier_data.get("description", ""),
-                "tier_type": tier_type,
-            },
+        created_coverages = 0
+        for tier, tier_data in tiers_data:
+            created_coverages += self._process_tier(tier, tier_data)
+
+        self.stdout.write(
+            f"Created {len(new_products)} product(s), {len(new_tiers)} tier(s) "
+            f"and {created_coverages} coverage(s) for {provider.name}."
         )
 
-        if tier_created:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Created tier '{tier_name}' for product '{product.name}'."
-                )
-            )
-        else:
-            self.stdout.write(
-                self.style.NOTICE(
-                    f"Tier '{tier_name}' already exists for product '{product.name}'."
-                )
-            )
+    def _process_tier(self, tier, tier_data) -> int:
+        """
+        Update the coverages, exclusions and benefits of the given product tier.
 
-        tier_modified = False
+        Returns the number of coverages created.
+        """
+        tier_name = tier.tier_name
 
+        # coverages are looked up, created and linked to the tier in batches, rather
+        # than with a round trip per coverage
+        coverages_data = {}
         for coverage_data in tier_data["coverage"]:
             coverage_type_input = coverage_data.get("coverage_type")
-            _coverage_type = coverage_type_input
-            coverage_type = (
-                coverage_type_input
-                if coverage_type_input in Coverage.CoverageType.values
-                else Coverage.CoverageType.OTHER
-            )
+            coverage_name = coverage_data.get("coverage_name", coverage_type_input)
+            coverages_data.setdefault(coverage_name, coverage_data)
 
-            coverage_name = coverage_data.get("coverage_name", _coverage_type)
-            coverage_limit = Decimal(coverage_data["coverage_limit"])
-
-            coverage, coverage_created = Coverage.objects.get_or_create(
-                coverage_name=coverage_name,
-                defaults={
-                    "coverage_limit": coverage_limit,
-                    "currency": coverage_data["currency"],
-                    "coverage_type": coverage_type,
-                    "description": coverage_data.get("description", ""),
-                },
+        coverages = {
+            coverage.coverage_name: coverage
+            for coverage in Coverage.objects.filter(
+                coverage_name__in=coverages_data.keys()
             )
-
-            if coverage_created:
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Created new coverage: {coverage_name} with type: {coverage_type} for tier: {tier_name}"
-                    )
-                )
-                tier_modified = True
-            else:
-                self.stdout.write(
+        }
+        new_coverages = []
+        for coverage_name, coverage_data in coverages_data.items():
+            coverage_type = coverage_data.get("coverage_type")
+            if coverage_type not in COVERAGE_TYPE_VALUES:
+                coverage_type = Coverage.CoverageType.OTHER
+
+            if coverage_name in coverages:
+                self._write_detail(
                     self.style.WARNING(
-                        f"Coverage {coverage_name} already exists with type: {coverage.coverage_type} for tier: {tier_name}"
+                        f"Coverage {coverage_name} already exists with type: {coverages[coverage_name].coverage_type} for tier: {tier_name}"
                     )
                 )
+                continue
 
-            if coverage not in tier.coverages.all():
-                tier.coverages.add(coverage)
-                self.stdout.write(
+            coverage = Coverage(
+                coverage_name=coverage_name,
+                coverage_limit=Decimal(coverage_data["coverage_limit"]),
+                currency=coverage_data["currency"],
+                coverage_type=coverage_type,
+                description=coverage_data.get("description", ""),
+            )
+            # `bulk_create` skips `save()`, which is where coverage IDs are assigned
+            coverage.coverage_id = coverage.generate_coverage_id()
+            coverages[coverage_name] = coverage
+            new_coverages.append(coverage)
+            self._write_detail(
+                self.style.SUCCESS(
+                    f"Created new coverage: {coverage_name} with type: {coverage_type} for tier: {tier_name}"
+                )
+            )
+
+        if new_coverages:
+            Coverage.objects.bulk_create(
+                new_coverages, batch_size=settings.SUPERPOOL_BULK_CREATE_BATCH_SIZE
+            )
+
+        linked_coverages = set(tier.coverages.values_list("pk", flat=True))
+        unlinked_coverages = [
+            coverage
+            for coverage in coverages.values()
+            if coverage.pk not in linked_coverages
+        ]
+        if unlinked_coverages:
+            tier.coverages.add(*unlinked_coverages)
+            for coverage in unlinked_coverages:
+                self._write_detail(
                     self.style.SUCCESS(
-                        f"Added coverage '{coverage_name}' to tier '{tier_name}'."
+                        f"Added coverage '{coverage.coverage_name}' to tier '{tier_name}'."
                     )
                 )
-                tier_modified = True
 
-        # Update exclusions and benefits only if they have changed
-        exclusions_list = tier_data.get("exclusions", [])
-        benefits_list = tier_data.get("benefits", [])
+        # Update exclusions and benefits only if they have changed. Coverages are
+        # linked through their own table, so they never require the tier to be saved
+        exclusions = "\n".join(tier_data.get("exclusions", []))
+        benefits = "\n".join(tier_data.get("benefits", []))
 
-        if tier.exclusions != "\n".join(exclusions_list) or tier.benefits != "\n".join(
-            benefits_list
-        ):
-            tier.exclusions = "\n".join(exclusions_list)
-            tier.benefits = "\n".join(benefits_list)
-            tier_modified = True
+        if tier.exclusions != exclusions or tier.benefits != benefits:
+            tier.exclusions = exclusions
+            tier.benefits = benefits
+            tier.save(update_fields=["exclusions", "benefits"])
 
-        # Save tier only if modified
-        if tier_modified:
-            tier.save()
+        return len(new_coverages)
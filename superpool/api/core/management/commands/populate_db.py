@@ -6,21 +6,47 @@ With this, we can have some data to work with when we start the application.
 Therefore, having actual testing experience
 """
 
-from pprint import pprint
-
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
 from faker import Faker
 
 from core.catalog.models import Product
 from core.management.fixtures.providers import InsuranceProductProvider
 from core.providers.models import Provider as Partner
 
+SAMPLE_PRODUCT_TYPES = (
+    "Auto",
+    # "CreditLife",
+    "Life",
+    "Travel",
+    "Health",
+    "Gadget",
+)
+""" Product types the sample products are picked from """
+
 
 class Command(BaseCommand):
     help = "Populate the database with initial data"
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.SUPERPOOL_BULK_CREATE_BATCH_SIZE,
+            help="Number of rows written per INSERT. Defaults to SUPERPOOL_BULK_CREATE_BATCH_SIZE",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Seed for the generated data, so that runs can be reproduced",
+        )
+
+    @transaction.atomic
     def handle(self, *args, **kwargs):
-        fake = Faker()
+        fake = Faker("en_US")
+        if kwargs["seed"] is not None:
+            fake.seed_instance(kwargs["seed"])
         insurance_provider = InsuranceProductProvider
         fake.add_provider(insurance_provider)
 
@@ -67,26 +93,25 @@ class Command(BaseCommand):
 
         # # Create 5 Products of 6 ditinct insurance types
 
-        for _ in range(10):
-            try:
-                Product.objects.create(
+        # provider keys are loaded once and the products written with a single
+        # INSERT. Products only need each provider's key, so no instances are built
+        provider_ids = list(Partner.objects.values_list("id", flat=True))
+        if not provider_ids:
+            self.stdout.write("No insurance providers found, skipping sample products")
+            return
+
+        Product.objects.bulk_create(
+            [
+                Product(
                     name=fake.random_company_product(),
                     description=fake.sentence(),
-                    product_type=fake.random_element(
-                        elements=(
-                            "Auto",
-                            # "CreditLife",
-                            "Life",
-                            "Travel",
-                            "Health",
-                            "Gadget",
-                        )
-                    ),
-                    provider=fake.random_element(Partner.objects.all()),
+                    product_type=fake.random_element(elements=SAMPLE_PRODUCT_TYPES),
+                    provider_id=fake.random.choice(provider_ids),
                 )
-            except Exception as e:
-                pprint(f"Error: {e}")
-                pass
+                for _ in range(10)
+            ],
+            batch_size=kwargs["batch_size"],
+        )
 
         # # Create 20 Policies
         # for _ in range(20):
@@ -165,4 +190,4 @@ class Command(BaseCommand):
         #         pprint(f"Error: {e}")
         #         pass
 
-        pprint("Database populated successfully")
+        self.stdout.write(self.style.SUCCESS("Database populated successfully"))
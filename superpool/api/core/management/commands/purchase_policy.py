@@ -9,6 +9,10 @@ from api.catalog.services import PolicyService
 from core.catalog.models import Quote
 from core.merchants.models import Merchant
 
+GENDERS = ("M", "F")
+PAYMENT_METHODS = ("card", "wallet", "bank_transfer", "online_banking")
+PAYMENT_STATUSES = ("completed", "pending")
+
 
 class Command(BaseCommand):
     """
@@ -59,7 +63,7 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             "--customer_gender",
-            choices=["M", "F"],
+            choices=GENDERS,
             type=str,
             required=False,
             help="Sexual orientation of the policy holder",
@@ -85,7 +89,7 @@ class Command(BaseCommand):
         parser.add_argument(
             "--payment_method",
             type=str,
-            choices=["card", "wallet", "bank_transfer", "online_banking"],
+            choices=PAYMENT_METHODS,
             default="card",
             help="Payment method to use for the purchase",
         )
@@ -98,7 +102,7 @@ class Command(BaseCommand):
         parser.add_argument(
             "--payment_status",
             type=str,
-            choices=["completed", "pending"],
+            choices=PAYMENT_STATUSES,
             help="Status of the payment",
             required=False,
         )
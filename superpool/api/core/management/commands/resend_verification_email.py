@@ -20,14 +20,15 @@ class Command(BaseCommand):
         short_code = options["short_code"]
         tenant_id = options.get("tenant_id")
 
+        # only the columns the verification email needs are loaded
+        merchants = Merchant.objects.only("business_email", "token", "short_code")
+
         try:
             if tenant_id:
                 # attempt to get merchant with both short_code and tenant_id
-                merchant = Merchant.objects.get(
-                    short_code=short_code, tenant_id=tenant_id
-                )
+                merchant = merchants.get(short_code=short_code, tenant_id=tenant_id)
             else:
-                merchant = Merchant.objects.get(short_code=short_code)
+                merchant = merchants.get(short_code=short_code)
 
             # merchant does not have a verification token?
             if not merchant.token:
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-18 08:13
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # `CREATE INDEX CONCURRENTLY` cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("core", "0008_provider_is_internal"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="coverage",
+            index=models.Index(fields=["coverage_name"], name="coverage_name_idx"),
+        ),
+    ]
@@ -18,6 +18,25 @@ class TimestampMixin(models.Model):
         abstract = True
 
 
+class TrashableQuerySet(models.QuerySet):
+    """
+    QuerySet that trashes rows in bulk rather than permanently deleting them
+    """
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Trash every row in the queryset with a single UPDATE statement
+        """
+        trashed = self.update(is_trashed=True, trashed_at=timezone.now())
+        return trashed, {self.model._meta.label: trashed}
+
+    def full_delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Permanently delete every row in the queryset
+        """
+        return super().delete()
+
+
 class TrashableModelMixin(models.Model):
     """
     Mixin class to add trashable functionality to models.
@@ -31,12 +50,17 @@ class TrashableModelMixin(models.Model):
         trashed_at: DateTimeField
         restored_at: DateTimeField
         trash: Method
+
+    Deleting a queryset of trashable models, e.g `Product.objects.filter(...).delete()`,
+    trashes all matching rows in one UPDATE. Use `full_delete()` to remove them for good.
     """
 
     is_trashed: models.BooleanField = models.BooleanField(default=False)
     trashed_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
     restored_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
 
+    objects = TrashableQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
@@ -46,7 +70,9 @@ class TrashableModelMixin(models.Model):
         """
         self.is_trashed = True
         self.trashed_at = timezone.now()
-        self.save()
+        type(self).objects.filter(pk=self.pk).update(
+            is_trashed=self.is_trashed, trashed_at=self.trashed_at
+        )
 
     def restore(self) -> None:
         """
@@ -54,7 +80,9 @@ class TrashableModelMixin(models.Model):
         """
         self.is_trashed = False
         self.restored_at = timezone.now()
-        self.save()
+        type(self).objects.filter(pk=self.pk).update(
+            is_trashed=self.is_trashed, restored_at=self.restored_at
+        )
 
     def delete(self, *args: dict, **kwargs: dict) -> None:
         """
@@ -106,6 +106,10 @@ class Coverage(models.Model):
     class Meta:
         verbose_name = _("Coverage")
         verbose_name_plural = _("Coverages")
+        indexes = [
+            # coverages are matched by name when ingesting insurer catalogues
+            models.Index(fields=["coverage_name"], name="coverage_name_idx"),
+        ]
 
     def generate_coverage_id(self):
         prefix = "COV_"
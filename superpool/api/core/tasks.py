@@ -0,0 +1,20 @@
+import logging
+from smtplib import SMTPException
+
+from celery import shared_task
+from django.core.mail import EmailMultiAlternatives
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(autoretry_for=(SMTPException,), retry_backoff=True, max_retries=5)
+def send_email(message: dict) -> None:
+    """
+    Sends an email message serialized with `BaseEmailMessage.to_dict()`
+    """
+    alternatives = message.pop("alternatives", [])
+    email = EmailMultiAlternatives(**message)
+    for content, mimetype in alternatives:
+        email.attach_alternative(content, mimetype)
+    email.send(fail_silently=False)
+    logger.info(f"Sent email '{email.subject}' to {len(email.to)} recipient(s)")
@@ -1 +1,84 @@
-# Create your tests here.
+from smtplib import SMTPException
+
+import pytest
+
+from api.merchants.tests.factories import MerchantFactory
+from core.emails import OnboardingEmail, send_password_reset_email
+from core.tasks import send_email
+
+
+def create_onboarding_email():
+    return OnboardingEmail(
+        "merchant@example.com",
+        tenant_id="tenant",
+        merchant_short_code="MRC",
+        from_="noreply@example.com",
+    )
+
+
+def test_email_send_is_delivered_synchronously_by_default(mailoutbox, mocker):
+    delay = mocker.patch("core.emails.send_email.delay")
+
+    create_onboarding_email().send()
+
+    (sent,) = mailoutbox
+    assert sent.to == ["merchant@example.com"]
+    delay.assert_not_called()
+
+
+def test_email_send_raises_delivery_failures_by_default(mocker):
+    mocker.patch(
+        "django.core.mail.backends.locmem.EmailBackend.send_messages",
+        side_effect=SMTPException,
+    )
+
+    with pytest.raises(SMTPException):
+        create_onboarding_email().send()
+
+
+@pytest.mark.django_db
+def test_email_send_is_dispatched_to_a_worker_on_commit(
+    settings, mocker, django_capture_on_commit_callbacks
+):
+    settings.SUPERPOOL_SEND_EMAILS_ASYNC = True
+    delay = mocker.patch("core.emails.send_email.delay")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_onboarding_email().send()
+
+    (message,) = delay.call_args.args
+    assert message["to"] == ["merchant@example.com"]
+    assert message["alternatives"][0][1] == "text/html"
+
+
+def test_send_email_task_delivers_serialized_message(mailoutbox):
+    send_email(create_onboarding_email().to_dict())
+
+    (sent,) = mailoutbox
+    assert sent.to == ["merchant@example.com"]
+    assert sent.alternatives[0][1] == "text/html"
+
+
+@pytest.mark.django_db
+def test_password_reset_email_is_delivered_synchronously_by_default(mailoutbox):
+    merchant = MerchantFactory()
+
+    send_password_reset_email(merchant, "https://example.com/reset")
+
+    (sent,) = mailoutbox
+    assert sent.to == [merchant.business_email]
+
+
+@pytest.mark.django_db
+def test_password_reset_email_is_dispatched_to_a_worker_on_commit(
+    settings, mocker, django_capture_on_commit_callbacks
+):
+    settings.SUPERPOOL_SEND_EMAILS_ASYNC = True
+    delay = mocker.patch("core.emails.send_email.delay")
+    merchant = MerchantFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        send_password_reset_email(merchant, "https://example.com/reset")
+
+    (message,) = delay.call_args.args
+    assert message["to"] == [merchant.business_email]